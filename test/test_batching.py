@@ -0,0 +1,115 @@
+"""
+Unit test untuk utils.batching
+
+Memastikan antrian terbatas menahan producer (backpressure), batch yang gagal
+dicoba ulang sendiri-sendiri, dan load dibatalkan jika batch tetap gagal.
+"""
+
+import unittest
+import os
+import sys
+import time
+import pandas as pd
+
+# Tambahkan path root proyek agar bisa import dari utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.batching import iter_batches, run_batched
+
+
+class RecordingSink:
+    """Sink tiruan yang mencatat batch dan bisa gagal pada percobaan tertentu"""
+
+    def __init__(self, delay=0.0, failures=None):
+        self.delay = delay
+        self.failures = dict(failures or {})  # nomor batch -> jumlah kegagalan
+        self.batches = []
+        self.closed = None
+
+    def open(self):
+        self.opened = True
+
+    def write(self, batch):
+        index = len(self.batches)
+        if self.failures.get(index, 0):
+            self.failures[index] -= 1
+            raise IOError(f"batch {index} gagal")
+        time.sleep(self.delay)
+        self.batches.append(batch)
+
+    def close(self, success):
+        self.closed = success
+
+
+class TestRunBatched(unittest.TestCase):
+    """Kelas unit test untuk run_batched"""
+
+    def setUp(self):
+        self.df = pd.DataFrame({"Title": [f"Item {i}" for i in range(100)], "Price": range(100)})
+
+    def test_iter_batches_are_fixed_size(self):
+        sizes = [len(batch) for batch in iter_batches(self.df, 30)]
+        self.assertEqual(sizes, [30, 30, 30, 10])
+        with self.assertRaises(ValueError):
+            list(iter_batches(self.df, 0))
+
+    def test_all_rows_written_in_order(self):
+        sink = RecordingSink()
+        stats = run_batched("test", iter_batches(self.df, 7), sink, queue_size=2)
+
+        self.assertTrue(stats["success"])
+        self.assertTrue(sink.closed)
+        self.assertEqual(stats["rows"], 100)
+        self.assertEqual(stats["batches"], 15)
+        pd.testing.assert_frame_equal(pd.concat(sink.batches), self.df)
+
+    def test_slow_sink_applies_backpressure(self):
+        produced = []
+
+        def batches():
+            for batch in iter_batches(self.df, 10):
+                produced.append(len(produced))
+                yield batch
+
+        sink = RecordingSink(delay=0.02)
+        stats = run_batched("test", batches(), sink, queue_size=2)
+
+        self.assertTrue(stats["success"])
+        self.assertLessEqual(stats["max_queue_depth"], 2)
+        self.assertGreater(stats["producer_wait_seconds"], 0.05)
+        self.assertGreater(stats["rows_per_second"], 0)
+
+    def test_failed_batch_is_retried_individually(self):
+        sink = RecordingSink(failures={3: 2})
+        stats = run_batched("test", iter_batches(self.df, 10), sink, max_retries=3, retry_backoff=0)
+
+        self.assertTrue(stats["success"])
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(len(sink.batches), 10)
+        pd.testing.assert_frame_equal(pd.concat(sink.batches), self.df)
+
+    def test_batch_failing_after_retries_aborts_load(self):
+        sink = RecordingSink(failures={2: 10})
+        stats = run_batched("test", iter_batches(self.df, 10), sink, max_retries=1, retry_backoff=0)
+
+        self.assertFalse(stats["success"])
+        self.assertIs(sink.closed, False)
+        self.assertEqual(stats["failed_batch"], 2)
+        self.assertEqual(stats["rows"], 20)
+        self.assertIn("batch 2 gagal", stats["error"])
+
+    def test_producer_error_aborts_load(self):
+        def batches():
+            yield self.df.iloc[:10]
+            raise ValueError("sumber rusak")
+
+        sink = RecordingSink()
+        stats = run_batched("test", batches(), sink)
+
+        self.assertFalse(stats["success"])
+        self.assertIs(sink.closed, False)
+        self.assertEqual(stats["error"], "sumber rusak")
+
+
+if __name__ == "__main__":
+    unittest.main()
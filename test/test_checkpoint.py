@@ -0,0 +1,239 @@
+"""
+Unit test untuk utils/checkpoint.py dan runner main.run_etl_pipeline
+
+Menguji apakah:
+- Output tahap tersimpan dan dimuat kembali sesuai fingerprint input
+- Run yang gagal hanya dilanjutkan dengan --resume, tanpa extract dan
+  transform ulang dan hanya memuat ulang destinasi yang gagal
+- Checkpoint transform tidak dipakai ulang jika aturan transformasi berubah
+- Run lama dihapus sesuai batas retensi
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import pandas as pd
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.checkpoint import CheckpointStore, fingerprint_dataframe, fingerprint_value
+import main
+
+
+class TestCheckpointStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(self.tmp_dir.name)
+        self.test_df = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2"],
+            "Price": [175840.0, 320000.0],
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_fingerprint_changes_with_content(self):
+        """Test fingerprint berubah jika isi data berubah."""
+        changed = self.test_df.copy()
+        changed.loc[0, "Price"] = 1.0
+        self.assertEqual(fingerprint_dataframe(self.test_df), fingerprint_dataframe(self.test_df.copy()))
+        self.assertNotEqual(fingerprint_dataframe(self.test_df), fingerprint_dataframe(changed))
+
+    def test_fingerprint_value_tracks_configuration(self):
+        """Test fingerprint konfigurasi stabil dan berubah jika nilai atau urutannya berubah."""
+        urls = ["https://fashion-studio.dicoding.dev/"]
+        self.assertEqual(fingerprint_value("extract", urls), fingerprint_value("extract", list(urls)))
+        self.assertEqual(fingerprint_value({"b": 1, "a": 2}), fingerprint_value({"a": 2, "b": 1}))
+        self.assertNotEqual(fingerprint_value("extract", urls), fingerprint_value("extract", urls + ["/page2"]))
+        self.assertNotEqual(fingerprint_value("a", "b"), fingerprint_value("b", "a"))
+
+    def test_save_and_load_stage(self):
+        """Test output tahap dimuat kembali jika fingerprint sama."""
+        self.store.save_stage("run-1", "transform", self.test_df, "abc")
+
+        pd.testing.assert_frame_equal(self.store.load_stage("run-1", "transform", "abc"), self.test_df)
+        self.assertIsNone(self.store.load_stage("run-1", "transform", "berbeda"))
+
+    def test_unchanged_input_reused_across_runs(self):
+        """Test checkpoint dari run lain dipakai jika input tidak berubah."""
+        self.store.save_stage("run-1", "transform", self.test_df, "abc")
+        pd.testing.assert_frame_equal(self.store.load_stage("run-2", "transform", "abc"), self.test_df)
+        self.assertIsNone(self.store.load_stage("run-2", "transform", "abc", any_run=False))
+
+    def test_prune_keeps_newest_runs(self):
+        """Test hanya run terbaru yang disimpan, kecuali run yang dikecualikan."""
+        store = CheckpointStore(self.tmp_dir.name, keep_runs=2)
+        for run_id in ["run-1", "run-2", "run-3", "run-4"]:
+            store.save_stage(run_id, "transform", self.test_df, "abc")
+
+        self.assertEqual(store.prune(exclude=["run-1"]), ["run-2"])
+        self.assertEqual(store.list_runs(), ["run-1", "run-3", "run-4"])
+        self.assertEqual(store.prune(), ["run-1"])
+        self.assertEqual(store.list_runs(), ["run-3", "run-4"])
+        with self.assertRaises(ValueError):
+            CheckpointStore(self.tmp_dir.name, keep_runs=0)
+
+    def test_latest_incomplete_run(self):
+        """Test hanya run terakhir yang belum selesai yang dilanjutkan."""
+        self.assertIsNone(self.store.latest_incomplete_run())
+        self.store.set_run_status("run-1", "failed")
+        self.assertEqual(self.store.latest_incomplete_run(), "run-1")
+        self.store.set_run_status("run-1", "completed")
+        self.assertIsNone(self.store.latest_incomplete_run())
+
+
+class TestResumePipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(os.path.join(self.tmp_dir.name, "checkpoints"))
+        self.raw_df = pd.DataFrame({
+            "Title": ["T-shirt 1"],
+            "Price": ["$10.99"],
+            "Rating": ["Rating: ⭐ 4.5 / 5"],
+            "Colour": ["3 Colors"],
+            "Size": ["Size: S"],
+            "Gender": ["Gender: Men"],
+        })
+        self.profile_dir = os.path.join(self.tmp_dir.name, "profiles")
+        for name, value in [
+            ("RAW_DATA_CSV", os.path.join(self.tmp_dir.name, "raw.csv")),
+            ("RAW_DATA_ARROW", os.path.join(self.tmp_dir.name, "raw.arrow")),
+            ("PROFILE_DIR", self.profile_dir),
+        ]:
+            patcher = patch.object(main, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch("main.load_data")
+    @patch("main.transform_data", side_effect=main.transform_data)
+    @patch("main.eksekusi_pengambilan_data")
+    def test_failed_load_resumes_from_load(self, mock_extract, mock_transform, mock_load):
+        """Test run yang gagal saat load dilanjutkan dengan resume tanpa scraping ulang."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": True, "postgresql": False}
+
+        run_id = main.run_etl_pipeline(store=self.store)
+        self.assertEqual(self.store.read_manifest(run_id)["status"], "failed")
+
+        mock_load.return_value = {"postgresql": True}
+        with self.assertLogs(level="WARNING") as logs:
+            resumed = main.run_etl_pipeline(store=self.store, resume=True)
+
+        self.assertEqual(resumed, run_id)
+        self.assertEqual(self.store.read_manifest(run_id)["status"], "completed")
+        self.assertTrue(any(f"RESUMING run {run_id}" in line for line in logs.output))
+        mock_extract.assert_called_once()
+        mock_transform.assert_called_once()
+        self.assertEqual(mock_load.call_count, 2)
+        # Destinasi yang sudah berhasil tidak dimuat ulang
+        self.assertEqual(mock_load.call_args.kwargs["destinations"], ["postgresql"])
+        self.assertEqual(
+            self.store.read_manifest(run_id)["stages"]["load"]["results"],
+            {"csv": True, "google_sheets": True, "postgresql": True}
+        )
+
+    @patch("main.load_data")
+    @patch("main.eksekusi_pengambilan_data")
+    def test_failed_run_not_resumed_by_default(self, mock_extract, mock_load):
+        """Test run baru tanpa resume selalu scraping ulang meskipun run terakhir gagal."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": False, "postgresql": True}
+
+        first = main.run_etl_pipeline(store=self.store)
+        second = main.run_etl_pipeline(store=self.store)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(mock_extract.call_count, 2)
+        self.assertIsNone(mock_load.call_args.kwargs["destinations"])
+
+    def test_resume_flag(self):
+        """Test opsi --resume tanpa atau dengan run ID."""
+        self.assertIsNone(main.parse_args([]).resume)
+        self.assertEqual(main.parse_args(["--resume"]).resume, "latest")
+        self.assertEqual(main.parse_args(["--resume", "run-1"]).resume, "run-1")
+
+    @patch("main.load_data")
+    @patch("main.eksekusi_pengambilan_data")
+    def test_completed_load_skipped_when_data_unchanged(self, mock_extract, mock_load):
+        """Test tahap load dilewati jika data bersih sama dengan run sebelumnya."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": True, "postgresql": True}
+
+        run_id = main.run_etl_pipeline(store=self.store)
+        main.run_etl_pipeline(run_id=run_id, store=self.store)
+
+        mock_extract.assert_called_once()
+        mock_load.assert_called_once()
+
+    @patch("main.load_data")
+    @patch("main.transform_data", side_effect=main.transform_data)
+    @patch("main.eksekusi_pengambilan_data")
+    def test_new_run_scrapes_again(self, mock_extract, mock_transform, mock_load):
+        """Test run baru selalu scraping ulang, tetapi transform dilewati jika data sama."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": True, "postgresql": True}
+
+        main.run_etl_pipeline(store=self.store)
+        main.run_etl_pipeline(store=self.store)
+
+        self.assertEqual(mock_extract.call_count, 2)
+        mock_transform.assert_called_once()
+
+    @patch("main.load_data")
+    @patch("main.transform_data", side_effect=main.transform_data)
+    @patch("main.eksekusi_pengambilan_data")
+    def test_changed_transform_rules_rerun_transform(self, mock_extract, mock_transform, mock_load):
+        """Test checkpoint transform run lama tidak dipakai jika versi transformasi berubah."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": True, "postgresql": True}
+
+        main.run_etl_pipeline(store=self.store)
+        with patch("utils.transform.TRANSFORM_VERSION", 999):
+            main.run_etl_pipeline(store=self.store)
+
+        self.assertEqual(mock_transform.call_count, 2)
+
+    @patch("main.load_data")
+    @patch("main.eksekusi_pengambilan_data")
+    def test_pipeline_prunes_old_runs(self, mock_extract, mock_load):
+        """Test runner menghapus run lama di luar batas retensi."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": True, "postgresql": True}
+        store = CheckpointStore(self.store.root, keep_runs=2)
+
+        run_ids = [main.run_etl_pipeline(store=store) for _ in range(3)]
+
+        self.assertEqual(store.list_runs(), run_ids[1:])
+
+    @patch("main.load_data")
+    @patch("main.eksekusi_pengambilan_data")
+    def test_raw_files_not_rewritten_after_default_extract(self, mock_extract, mock_load):
+        """Test file mentah hanya ditulis jika data tidak dibaca dari file tersebut."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": True, "postgresql": True}
+
+        main.run_etl_pipeline(store=self.store)
+        self.assertFalse(os.path.exists(main.RAW_DATA_ARROW))
+
+        main.run_etl_pipeline(store=self.store, extract_fn=lambda: self.raw_df)
+        self.assertTrue(os.path.exists(main.RAW_DATA_ARROW))
+        self.assertEqual(len(pd.read_csv(main.RAW_DATA_CSV)), 1)
+
+    @patch("main.load_data")
+    @patch("main.eksekusi_pengambilan_data")
+    def test_profile_written_per_transformed_run(self, mock_extract, mock_load):
+        """Test profil data ditulis ke PROFILE_DIR untuk run yang menjalankan transform."""
+        mock_extract.return_value = self.raw_df
+        mock_load.return_value = {"csv": True, "google_sheets": True, "postgresql": True}
+
+        run_id = main.run_etl_pipeline(store=self.store)
+
+        self.assertEqual(os.listdir(self.profile_dir), [f"{run_id}.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,13 @@
 import unittest
 import os
 import sys
+import json
+import time
+import threading
+import subprocess
+import tempfile
 import pandas as pd
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
 from scrapy.http import HtmlResponse
 from scrapy import Request
@@ -9,7 +15,74 @@ from scrapy import Request
 # Tambahkan path root proyek ke PYTHONPATH agar bisa import dari utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.extract import FashionSpider, eksekusi_pengambilan_data
+from utils.extract import FashionSpider, eksekusi_pengambilan_data, TokenBucket
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MOCK_PAGE = """
+<div class="collection-card">
+    <div class="product-details">
+        <h3 class="product-title">T-shirt {page}</h3>
+        <div class="price-container"><span class="price">$15.00</span></div>
+        <p>Rating: ⭐ 4.0 / 5</p>
+        <p>3 Colors</p>
+        <p>Size: M</p>
+        <p>Gender: Women</p>
+    </div>
+</div>
+{pagination}
+"""
+
+CRAWL_SCRIPT = """
+import json, sys
+sys.path.insert(0, sys.argv[1])
+from scrapy.crawler import CrawlerProcess
+from utils.extract import FashionSpider
+
+class MockSpider(FashionSpider):
+    custom_settings = dict(FashionSpider.custom_settings,
+                           POLITENESS_BACKOFF_BASE=0.1, LOG_LEVEL="ERROR")
+
+process = CrawlerProcess()
+crawler = process.create_crawler(MockSpider)
+process.crawl(crawler, start_urls=[sys.argv[2]])
+process.start()
+stats = crawler.stats.get_stats()
+print(json.dumps({k: v for k, v in stats.items() if isinstance(v, (int, float))}))
+"""
+
+
+class FlakyFashionHandler(BaseHTTPRequestHandler):
+    """Server tiruan: setiap halaman menolak request pertama dengan 503/429 dan membalas lambat."""
+
+    seen = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            first_visit = self.path not in self.seen
+            self.seen.add(self.path)
+
+        time.sleep(0.05)  # Injeksi latensi
+        if first_visit:
+            self.send_response(503 if "page" in self.path else 429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+
+        page = int(self.path.split("=")[-1]) if "page" in self.path else 1
+        pagination = (
+            f'<ul><li class="page-item next"><a class="page-link" href="/?page={page + 1}">Next</a></li></ul>'
+            if page < 3 else ""
+        )
+        body = MOCK_PAGE.format(page=page, pagination=pagination).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
 
 
 class TestFashionSpider(unittest.TestCase):
@@ -180,5 +253,44 @@ class TestFashionSpider(unittest.TestCase):
         os.remove(output_file)
 
 
+
+class TestPoliteness(unittest.TestCase):
+    """Unit test untuk rate limit dan retry pada profil crawling."""
+
+    def test_token_bucket_allows_burst_then_waits(self):
+        """Token bucket mengizinkan burst lalu meminta waktu tunggu."""
+        bucket = TokenBucket(rate=2.0, capacity=2.0)
+        self.assertEqual(bucket.reserve(0.0), 0.0)
+        self.assertEqual(bucket.reserve(0.0), 0.0)
+        self.assertAlmostEqual(bucket.reserve(0.0), 0.5)
+        self.assertEqual(bucket.reserve(1.0), 0.0)
+        self.assertAlmostEqual(bucket.reserve(1.0), 0.5)
+
+    def test_crawl_against_flaky_mock_server(self):
+        """Crawl ke server lokal yang lambat dan mengembalikan 429/503 tetap selesai."""
+        FlakyFashionHandler.seen = set()
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyFashionHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                output = subprocess.run(
+                    [sys.executable, "-c", CRAWL_SCRIPT, PROJECT_ROOT, url],
+                    cwd=tmp_dir, capture_output=True, text=True, timeout=120
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(output.returncode, 0, output.stderr)
+        stats = json.loads(output.stdout.strip().splitlines()[-1])
+        self.assertEqual(stats["item_scraped_count"], 3)
+        self.assertEqual(stats["politeness/retries"], 3)
+        self.assertEqual(stats["politeness/status_429"], 1)
+        self.assertEqual(stats["politeness/status_503"], 2)
+        self.assertGreater(stats["politeness/requests_per_second"], 0)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -10,11 +10,80 @@ Menguji apakah fungsi load_data():
 import unittest
 import os
 import sys
+import gzip
+import tempfile
+import sqlite3
+from datetime import date
 import pandas as pd
 from unittest.mock import patch, MagicMock
+from sqlalchemy.exc import SQLAlchemyError
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.load import load_data
+from utils.load import (
+    load_data, save_to_csv, atomic_csv_writer, save_to_sqlite, query_sqlite,
+    sync_google_sheets, upload_to_google_sheets, save_to_postgres, build_postgres_ddl,
+    load_batched, CsvSink, SheetsSink, PostgresSink, SqliteSink
+)
+
+class _Call:
+    def __init__(self, func):
+        self.func = func
+
+    def execute(self):
+        return self.func()
+
+
+class FakeSheetsService:
+    """Tiruan lokal Google Sheets API yang menyimpan sel dalam list of list."""
+
+    def __init__(self, rows=None):
+        self.rows = [list(r) for r in (rows or [])]
+        self.calls = []
+
+    @staticmethod
+    def _row_numbers(a1_range):
+        cells = a1_range.split("!")[-1].split(":")
+        start = int("".join(ch for ch in cells[0] if ch.isdigit()) or 1)
+        end = int("".join(ch for ch in cells[-1] if ch.isdigit()) or start)
+        return start, end
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId, range):
+        self.calls.append("get")
+        return _Call(lambda: {"values": [list(r) for r in self.rows]})
+
+    def clear(self, spreadsheetId, range, body):
+        self.calls.append("clear")
+        return _Call(lambda: self.rows.clear() or {})
+
+    def update(self, spreadsheetId, range, valueInputOption, body):
+        self.calls.append("update")
+        return _Call(lambda: self._write(range, body["values"]))
+
+    def batchUpdate(self, spreadsheetId, body):
+        if "data" in body:
+            self.calls.append("values.batchUpdate")
+            return _Call(lambda: [self._write(d["range"], d["values"]) for d in body["data"]])
+        self.calls.append("batchUpdate")
+        return _Call(lambda: [self._delete(r["deleteDimension"]["range"]) for r in body["requests"]])
+
+    def _write(self, a1_range, values):
+        start, _ = self._row_numbers(a1_range)
+        for offset, row in enumerate(values):
+            index = start - 1 + offset
+            while len(self.rows) <= index:
+                self.rows.append([])
+            self.rows[index] = list(row)
+        return {"updatedCells": sum(len(row) for row in values)}
+
+    def _delete(self, grid_range):
+        del self.rows[grid_range["startIndex"]:grid_range["endIndex"]]
+
 
 class TestLoadData(unittest.TestCase):
     def setUp(self):
@@ -130,5 +199,438 @@ class TestLoadData(unittest.TestCase):
         self.assertFalse(result["google_sheets"])
         self.assertTrue(result["postgresql"])
 
+    @patch('utils.load.save_to_csv', return_value=True)
+    @patch('utils.load.upload_to_google_sheets', return_value=True)
+    @patch('utils.load.save_to_postgres', return_value=True)
+    @patch('utils.load.save_to_sqlite', return_value=True)
+    def test_local_db_is_optional(self, mock_sqlite, mock_postgres, mock_gsheet, mock_csv):
+        """Test bahwa SQLite hanya dipakai jika local_db diisi."""
+        result = load_data(self.test_df, self.db_url, self.csv_output)
+        mock_sqlite.assert_not_called()
+        self.assertNotIn("sqlite", result)
+
+        result = load_data(self.test_df, self.db_url, self.csv_output, local_db="test.db")
+        mock_sqlite.assert_called_once()
+        self.assertTrue(result["sqlite"])
+
+    @patch('utils.load.save_to_csv', return_value=True)
+    @patch('utils.load.upload_to_google_sheets', return_value=True)
+    @patch('utils.load.save_to_postgres', return_value=True)
+    def test_only_selected_destinations_loaded(self, mock_postgres, mock_gsheet, mock_csv):
+        """Test bahwa hanya destinasi yang dipilih yang dimuat (mis. saat resume)."""
+        result = load_data(self.test_df, self.db_url, self.csv_output, destinations=["postgresql"])
+        self.assertEqual(result, {"postgresql": True})
+        mock_csv.assert_not_called()
+        mock_gsheet.assert_not_called()
+
+
+class TestSaveToCsv(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.test_df = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2", "Pants 3"],
+            "Price": [175840.0, 320000.0, 160000.0],
+            "Gender": ["Men", "Women", "Men"]
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_chunked_write_roundtrip(self):
+        """Test bahwa penulisan per potongan menghasilkan CSV yang utuh."""
+        output = os.path.join(self.tmp_dir.name, "clean.csv")
+        self.assertTrue(save_to_csv(self.test_df, output, chunksize=1))
+        pd.testing.assert_frame_equal(pd.read_csv(output), self.test_df)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["clean.csv"])
+
+    def test_gzip_compression(self):
+        """Test bahwa kompresi gzip dapat dibaca kembali."""
+        output = os.path.join(self.tmp_dir.name, "clean.csv.gz")
+        self.assertTrue(save_to_csv(self.test_df, output, compression="gzip"))
+        with gzip.open(output, "rt") as fh:
+            pd.testing.assert_frame_equal(pd.read_csv(fh), self.test_df)
+
+    def test_failed_write_keeps_previous_file(self):
+        """Test bahwa error di tengah penulisan tidak merusak file lama."""
+        output = os.path.join(self.tmp_dir.name, "clean.csv")
+        self.test_df.to_csv(output, index=False)
+
+        with self.assertRaises(RuntimeError):
+            with atomic_csv_writer(output) as handle:
+                handle.write("Title,Price\n")
+                raise RuntimeError("Simulasi crash")
+
+        pd.testing.assert_frame_equal(pd.read_csv(output), self.test_df)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["clean.csv"])
+
+    def read_partition(self, output, name):
+        directory = os.path.join(output, name)
+        return pd.concat(
+            [pd.read_csv(os.path.join(directory, part)) for part in sorted(os.listdir(directory))],
+            ignore_index=True,
+        )
+
+    def test_partitioned_append_keeps_new_rows(self):
+        """Test bahwa run inkremental menambah part baru tanpa membuang baris partisi lama."""
+        output = os.path.join(self.tmp_dir.name, "products")
+        self.assertTrue(save_to_csv(self.test_df, output, partition_by="Gender", part_name="part-1"))
+        self.assertEqual(sorted(os.listdir(output)), ["Gender=Men", "Gender=Women"])
+
+        next_run = pd.DataFrame({
+            "Title": ["Jacket 4", "Hoodie 5"],
+            "Price": [200000.0, 250000.0],
+            "Gender": ["Men", "Unisex"]
+        })
+        self.assertTrue(save_to_csv(next_run, output, partition_by="Gender", part_name="part-2"))
+
+        self.assertEqual(sorted(os.listdir(output)), ["Gender=Men", "Gender=Unisex", "Gender=Women"])
+        self.assertEqual(sorted(os.listdir(os.path.join(output, "Gender=Men"))), ["part-1.csv", "part-2.csv"])
+        self.assertEqual(
+            self.read_partition(output, "Gender=Men")["Title"].tolist(),
+            ["T-shirt 1", "Pants 3", "Jacket 4"]
+        )
+        self.assertEqual(self.read_partition(output, "Gender=Unisex")["Title"].tolist(), ["Hoodie 5"])
+
+    def test_partitioned_rerun_replaces_same_part(self):
+        """Test bahwa run yang diulang dengan part_name sama tidak menggandakan baris."""
+        output = os.path.join(self.tmp_dir.name, "products")
+        self.assertTrue(save_to_csv(self.test_df, output, partition_by="Gender", part_name="part-1"))
+        self.assertTrue(save_to_csv(self.test_df, output, partition_by="Gender", part_name="part-1"))
+        self.assertEqual(len(self.read_partition(output, "Gender=Men")), 2)
+
+    def test_partitioned_default_part_names_are_unique(self):
+        """Test bahwa tanpa part_name tiap run menulis file part baru."""
+        output = os.path.join(self.tmp_dir.name, "products")
+        self.assertTrue(save_to_csv(self.test_df, output, partition_by="Gender"))
+        self.assertTrue(save_to_csv(self.test_df, output, partition_by="Gender"))
+        self.assertEqual(len(os.listdir(os.path.join(output, "Gender=Women"))), 2)
+        self.assertEqual(len(self.read_partition(output, "Gender=Men")), 4)
+
+    def test_unsupported_compression_fails(self):
+        """Test bahwa kompresi tidak dikenal menghasilkan False."""
+        output = os.path.join(self.tmp_dir.name, "clean.csv")
+        self.assertFalse(save_to_csv(self.test_df, output, compression="bz2"))
+
+
+
+class TestSyncGoogleSheets(unittest.TestCase):
+    def setUp(self):
+        self.test_df = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2", "Pants 3", "Jacket 4"],
+            "Price": [175840.0, 320000.0, 160000.0, 400000.0],
+            "Size": ["S", "L", "M", "XL"],
+            "Gender": ["Men", "Women", "Men", "Unisex"],
+            "Timestamp": ["2025-05-16 18:42:36"] * 4,
+        })
+        self.service = FakeSheetsService()
+        sync_google_sheets(self.test_df, service=self.service)
+        self.service.calls.clear()
+
+    def sheet_as_df(self):
+        return pd.DataFrame(self.service.rows[1:], columns=self.service.rows[0])
+
+    def test_initial_sync_writes_everything(self):
+        """Test sheet kosong ditulis penuh."""
+        self.assertEqual(len(self.service.rows), 5)
+        self.assertEqual(self.service.rows[0], list(self.test_df.columns))
+
+    def test_unchanged_data_writes_nothing(self):
+        """Test data yang sama (selain Timestamp) tidak menulis sel apa pun."""
+        same = self.test_df.assign(Timestamp="2025-05-17 08:00:00")
+        stats = sync_google_sheets(same, service=self.service)
+        self.assertEqual(stats["cells"], 0)
+        self.assertEqual(self.service.calls, ["get"])
+
+    def test_changed_appended_and_deleted_rows(self):
+        """Test hanya baris berubah, baru, dan hilang yang dikirim."""
+        new_df = self.test_df.copy()
+        new_df.loc[1, "Price"] = 330000.0                  # berubah
+        new_df = new_df.drop(index=[0, 2])                 # dihapus
+        new_df = pd.concat([new_df, pd.DataFrame({         # baru
+            "Title": ["Hoodie 5"], "Price": [250000.0], "Size": ["M"],
+            "Gender": ["Men"], "Timestamp": ["2025-05-16 18:42:36"]
+        })], ignore_index=True)
+
+        stats = sync_google_sheets(new_df, service=self.service)
+
+        self.assertEqual((stats["updated"], stats["appended"], stats["deleted"]), (1, 1, 2))
+        self.assertEqual(stats["cells"], 2 * len(new_df.columns))
+        self.assertEqual(self.service.calls, ["get", "batchUpdate", "values.batchUpdate"])
+        pd.testing.assert_frame_equal(
+            self.sheet_as_df().sort_values("Title").reset_index(drop=True),
+            new_df.astype(str).sort_values("Title").reset_index(drop=True)
+        )
+
+    def test_cache_skips_reading_sheet(self):
+        """Test cache isi sheet menghindari request baca."""
+        new_df = self.test_df.copy()
+        new_df.loc[3, "Price"] = 1.0
+        sync_google_sheets(new_df, service=self.service, use_cache=True)
+        self.assertEqual(self.service.calls, ["values.batchUpdate"])
+        self.assertEqual(self.service.rows[4][1], "1.0")
+
+    def test_header_change_rewrites_sheet(self):
+        """Test perubahan header menulis ulang seluruh sheet."""
+        stats = sync_google_sheets(self.test_df.drop(columns=["Timestamp"]), service=self.service)
+        self.assertEqual(self.service.calls, ["get", "clear", "update"])
+        self.assertEqual(stats["cells"], 5 * 4)
+        self.assertEqual(len(self.service.rows[0]), 4)
+
+    def test_upload_in_diff_mode(self):
+        """Test upload_to_google_sheets meneruskan mode diff."""
+        self.assertTrue(upload_to_google_sheets(self.test_df, mode="diff", service=self.service))
+        self.assertEqual(self.service.calls, ["get"])
+
+
+class TestSaveToPostgres(unittest.TestCase):
+    def setUp(self):
+        self.test_df = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2"],
+            "Price": [175840.0, 320000.0],
+            "Rating": [4.5, 3.8],
+            "Colour": [3, 5],
+            "Size": ["S", "L"],
+            "Gender": ["Men", "Women"],
+            "Timestamp": ["2025-05-16 18:42:36"] * 2,
+        })
+
+    def run_save(self, df, **kwargs):
+        """Jalankan save_to_postgres dengan engine tiruan dan kembalikan SQL yang dieksekusi."""
+        with patch('utils.load.create_engine') as mock_engine, \
+             patch.dict('utils.load._engine_cache', clear=True):
+            conn = mock_engine.return_value.begin.return_value.__enter__.return_value
+            conn.execute.return_value.rowcount = 0
+            self.assertTrue(save_to_postgres(df, "postgresql://test", **kwargs))
+        return [str(call.args[0]) for call in conn.execute.call_args_list], conn
+
+    def test_ddl_has_types_and_primary_key(self):
+        """Test DDL memiliki tipe kolom eksplisit dan primary key."""
+        ddl = build_postgres_ddl("fashion_products")
+        self.assertIn('"Price" NUMERIC(14, 2) NOT NULL', ddl)
+        self.assertIn('PRIMARY KEY ("id")', ddl)
+        self.assertNotIn("PARTITION BY", ddl)
+
+    def test_free_text_columns_have_no_length_limit(self):
+        """Test kolom teks bebas (Size, Gender) memakai TEXT agar nilai panjang tidak menggagalkan load."""
+        ddl = build_postgres_ddl("fashion_products")
+        self.assertIn('"Size" TEXT NOT NULL', ddl)
+        self.assertIn('"Gender" TEXT NOT NULL', ddl)
+        self.assertNotIn("VARCHAR", ddl)
+
+        with patch('utils.load.create_engine') as mock_engine, \
+             patch.dict('utils.load._engine_cache', clear=True):
+            conn = mock_engine.return_value.begin.return_value.__enter__.return_value
+            conn.execute.return_value.__iter__.side_effect = lambda: iter([
+                ("id", "bigint"), ("load_date", "date"), ("Size", "character varying"), ("Gender", "text"),
+            ])
+            conn.execute.return_value.rowcount = 0
+            self.assertTrue(save_to_postgres(self.test_df, "postgresql://test"))
+
+        statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+        self.assertIn('ALTER TABLE "fashion_products" ALTER COLUMN "Size" TYPE TEXT', statements)
+        self.assertNotIn('ALTER TABLE "fashion_products" ALTER COLUMN "Gender" TYPE TEXT', statements)
+
+    def test_partitioned_ddl(self):
+        """Test DDL partisi per load_date."""
+        ddl = build_postgres_ddl("fashion_products", partitioned=True)
+        self.assertIn('PARTITION BY RANGE ("load_date")', ddl)
+        self.assertIn('PRIMARY KEY ("id", "load_date")', ddl)
+
+    def test_load_does_not_rebuild_table(self):
+        """Test load mengganti seluruh isi tabel tanpa DROP TABLE, lalu membuat indeks."""
+        statements, conn = self.run_save(self.test_df)
+        joined = "\n".join(statements)
+        self.assertNotIn("DROP TABLE", joined)
+        self.assertIn("CREATE TABLE IF NOT EXISTS", joined)
+        # Tabel tanpa partisi hanya berisi katalog terbaru, bukan snapshot per hari
+        self.assertIn('DELETE FROM "fashion_products"', statements)
+        for col in ["gender", "size", "price"]:
+            self.assertIn(f'CREATE INDEX IF NOT EXISTS "idx_fashion_products_{col}"', joined)
+        self.assertNotIn("ANALYZE", joined)  # perubahan kecil
+
+        insert_call = [c for c in conn.execute.call_args_list if str(c.args[0]).startswith("INSERT")][0]
+        self.assertEqual(len(insert_call.args[1]), 2)
+
+    @patch('utils.load.POSTGRES_BULK_THRESHOLD', 2)
+    @patch('utils.load.POSTGRES_ANALYZE_THRESHOLD', 2)
+    def test_bulk_load_defers_indexes_and_analyzes(self):
+        """Test load besar melepas indeks sebelum insert dan menjalankan ANALYZE."""
+        statements, _ = self.run_save(self.test_df)
+        kinds = [stmt.split()[0] for stmt in statements]
+
+        self.assertLess(kinds.index("DROP"), kinds.index("INSERT"))
+        self.assertLess(kinds.index("INSERT"), kinds.index("CREATE", kinds.index("INSERT")))
+        self.assertEqual(statements[-1], 'ANALYZE "fashion_products"')
+
+    @patch('utils.load.POSTGRES_BULK_THRESHOLD', 2)
+    @patch('utils.load.POSTGRES_ANALYZE_THRESHOLD', 2)
+    def test_partitioned_bulk_load_keeps_indexes_of_other_days(self):
+        """Test load besar berpartisi tidak melepas indeks induk dan hanya meng-ANALYZE partisi hari itu."""
+        statements, _ = self.run_save(self.test_df, partitioned=True, load_date=date(2025, 5, 16))
+
+        self.assertIn('PARTITION OF "fashion_products"', "\n".join(statements))
+        self.assertIn('TRUNCATE "fashion_products_20250516"', statements)
+        self.assertFalse([stmt for stmt in statements if stmt.startswith("DROP")])
+        self.assertEqual(statements[-1], 'ANALYZE "fashion_products_20250516"')
+
+
+class TestSaveToSqlite(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_file = os.path.join(self.tmp_dir.name, "products.db")
+        self.test_df = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2"],
+            "Price": [175840.0, 320000.0],
+            "Rating": [4.5, 3.8],
+            "Colour": [3, 5],
+            "Size": ["S", "L"],
+            "Gender": ["Men", "Women"]
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_incremental_append_and_query(self):
+        """Test bahwa data ditambahkan dan bisa diagregasi secara lokal."""
+        self.assertTrue(save_to_sqlite(self.test_df, self.db_file))
+        self.assertTrue(save_to_sqlite(self.test_df, self.db_file))
+
+        result = query_sqlite(
+            'SELECT "Gender", COUNT(*) AS n FROM fashion_products GROUP BY "Gender" ORDER BY "Gender"',
+            self.db_file
+        )
+        self.assertEqual(result["n"].tolist(), [2, 2])
+
+    def test_indexes_created(self):
+        """Test bahwa indeks Title/Gender/Size dibuat."""
+        self.assertTrue(save_to_sqlite(self.test_df, self.db_file))
+        indexes = query_sqlite(
+            "SELECT name FROM sqlite_master WHERE type = 'index' ORDER BY name", self.db_file
+        )
+        self.assertEqual(indexes["name"].tolist(), [
+            "idx_fashion_products_gender",
+            "idx_fashion_products_size",
+            "idx_fashion_products_title",
+        ])
+
+
+class TestLoadBatched(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.test_df = pd.DataFrame({
+            "Title": [f"Item {i}" for i in range(25)],
+            "Price": [1000.0 + i for i in range(25)],
+            "Rating": [4.5] * 25,
+            "Colour": [3] * 25,
+            "Size": ["M"] * 25,
+            "Gender": ["Men", "Women", "Unisex", "Men", "Women"] * 5,
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_csv_sqlite_and_sheets_batches(self):
+        """Test tiap destinasi menerima semua baris dalam batch berukuran tetap."""
+        csv_path = os.path.join(self.tmp_dir.name, "products.csv")
+        db_file = os.path.join(self.tmp_dir.name, "products.db")
+        service = FakeSheetsService()
+        stats = load_batched(
+            self.test_df,
+            {
+                "csv": CsvSink(csv_path, self.test_df.columns),
+                "sqlite": SqliteSink(db_file),
+                "google_sheets": SheetsSink(self.test_df.columns, service=service),
+            },
+            batch_sizes={"csv": 10, "sqlite": 7, "google_sheets": 5},
+            queue_size=2,
+        )
+
+        self.assertTrue(all(stat["success"] for stat in stats.values()))
+        self.assertEqual(
+            {name: stat["batches"] for name, stat in stats.items()},
+            {"csv": 3, "sqlite": 4, "google_sheets": 5},
+        )
+        pd.testing.assert_frame_equal(pd.read_csv(csv_path), self.test_df)
+        self.assertEqual(query_sqlite("SELECT COUNT(*) AS n FROM fashion_products", db_file)["n"][0], 25)
+        self.assertEqual(len(service.rows), 26)
+        self.assertEqual(service.rows[0], list(self.test_df.columns))
+        self.assertEqual(service.rows[-1][0], "Item 24")
+
+    def test_failed_batch_rolls_back_destination(self):
+        """Test batch yang tetap gagal membatalkan load tanpa file/baris setengah jadi."""
+        csv_path = os.path.join(self.tmp_dir.name, "products.csv")
+        db_file = os.path.join(self.tmp_dir.name, "products.db")
+        self.assertTrue(save_to_sqlite(self.test_df.head(2), db_file))
+        bad_df = self.test_df.astype({"Title": object})
+        bad_df.loc[20, "Title"] = object()  # Tidak bisa disimpan oleh SQLite
+
+        stats = load_batched(bad_df, {"sqlite": SqliteSink(db_file)}, {"sqlite": 10}, max_retries=1)
+
+        self.assertFalse(stats["sqlite"]["success"])
+        self.assertEqual(stats["sqlite"]["failed_batch"], 2)
+        self.assertEqual(stats["sqlite"]["retries"], 1)
+        self.assertEqual(query_sqlite("SELECT COUNT(*) AS n FROM fashion_products", db_file)["n"][0], 2)
+
+        sink = CsvSink(csv_path, self.test_df.columns)
+        sink.open()
+        sink.write(self.test_df.head(5))
+        sink.close(False)
+        self.assertFalse(os.path.exists(csv_path))
+        self.assertFalse([name for name in os.listdir(self.tmp_dir.name) if name.endswith(".tmp")])
+
+    def test_postgres_batches_use_savepoints(self):
+        """Test tiap batch PostgreSQL di-insert dalam SAVEPOINT dan di-commit sekali."""
+        with patch('utils.load.create_engine') as mock_engine, \
+             patch.dict('utils.load._engine_cache', clear=True):
+            conn = mock_engine.return_value.connect.return_value
+            conn.execute.return_value.rowcount = 0
+            stats = load_batched(
+                self.test_df, {"postgresql": PostgresSink("postgresql://test", expected_rows=25)},
+                {"postgresql": 10}
+            )
+
+        self.assertTrue(stats["postgresql"]["success"])
+        inserts = [c for c in conn.execute.call_args_list if str(c.args[0]).startswith("INSERT")]
+        self.assertEqual([len(c.args[1]) for c in inserts], [10, 10, 5])
+        self.assertEqual(conn.begin_nested.call_count, 3)
+        conn.begin.return_value.commit.assert_called_once()
+        conn.close.assert_called_once()
+
+    def test_failed_open_releases_connections(self):
+        """Test koneksi PostgreSQL/SQLite dilepas jika persiapan load gagal di open()."""
+        with patch('utils.load.create_engine') as mock_engine, \
+             patch.dict('utils.load._engine_cache', clear=True):
+            pg_conn = mock_engine.return_value.connect.return_value
+            pg_conn.execute.side_effect = SQLAlchemyError("permission denied")
+            with patch('utils.load.sqlite3.connect') as mock_sqlite:
+                mock_sqlite.return_value.execute.side_effect = sqlite3.OperationalError("database is locked")
+                stats = load_batched(self.test_df, {
+                    "postgresql": PostgresSink("postgresql://test"),
+                    "sqlite": SqliteSink(os.path.join(self.tmp_dir.name, "products.db")),
+                })
+
+        self.assertFalse(stats["postgresql"]["success"])
+        self.assertFalse(stats["sqlite"]["success"])
+        pg_conn.close.assert_called_once()
+        mock_sqlite.return_value.close.assert_called_once()
+
+    @patch('utils.load.get_engine')
+    @patch('utils.load._build_sheets_service')
+    def test_load_data_batched(self, mock_service, mock_engine):
+        """Test load_data(batched=True) mengembalikan status per destinasi."""
+        mock_service.return_value = FakeSheetsService()
+        mock_engine.return_value.connect.return_value.execute.return_value.rowcount = 0
+        csv_path = os.path.join(self.tmp_dir.name, "products.csv")
+
+        result = load_data(self.test_df, "postgresql://test", csv_path, batched=True,
+                           batch_sizes={"csv": 4})
+
+        self.assertEqual(result, {"csv": True, "google_sheets": True, "postgresql": True})
+        self.assertEqual(len(pd.read_csv(csv_path)), 25)
+
+        result = load_data(self.test_df, "postgresql://test", csv_path, batched=True,
+                           destinations=["csv"])
+        self.assertEqual(result, {"csv": True})
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit test untuk utils.mmap_io
+
+Memastikan data mentah dibaca dari Arrow IPC secara memory-map (zero-copy),
+hasilnya sama dengan pd.read_csv, dan CSV yang lebih baru dikonversi ulang.
+"""
+
+import unittest
+import os
+import sys
+import time
+import tempfile
+import pandas as pd
+import pyarrow as pa
+
+# Tambahkan path root proyek agar bisa import dari utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.mmap_io import read_dataframe, read_table, write_ipc
+from utils.transform import transform_data
+from utils.transform_arrow import transform_table
+
+
+RATES = pd.DataFrame({
+    "Currency": ["USD", "IDR"],
+    "Rate": [16000.0, 1.0],
+    "Date": pd.to_datetime(["2025-01-01", "2025-01-01"]),
+})
+
+
+def as_python(df):
+    """Menyamakan representasi null (NaN, None, pd.NA) agar hasil dapat dibandingkan"""
+    df = df.drop(columns="Timestamp", errors="ignore").astype(object)
+    return df.where(df.notna(), None)
+
+
+class TestMemoryMappedReader(unittest.TestCase):
+    """Kelas unit test untuk pembacaan Arrow IPC memory-map"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp.name, "raw.csv")
+        self.ipc_path = os.path.join(self.tmp.name, "raw.arrow")
+        self.raw = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2", None, "T-shirt 1"],
+            "Price": ["$10.99", "Price Unavailable", "$5", "$10.99"],
+            "Rating": ["Rating: ⭐ 4.5 / 5", "Rating: ⭐ 3.0 / 5", "Rating: ⭐ 2.0 / 5", "Rating: ⭐ 4.5 / 5"],
+            "Colour": ["3 Colors", "5 Colors", "1 Colors", "3 Colors"],
+            "Size": ["Size: M", "Size: L", "Size: S", "Size: M"],
+            "Gender": ["Gender: Men", "Gender: Women", "Gender: Unisex", "Gender: Men"],
+        })
+        self.raw.to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_csv_is_converted_and_memory_mapped(self):
+        """Test CSV dikonversi ke Arrow IPC dan dibaca memory-map tanpa alokasi baru."""
+        table = read_table(self.ipc_path, self.csv_path)
+        self.assertTrue(os.path.exists(self.ipc_path))
+        self.assertEqual(table.num_rows, 4)
+        # Tidak ada buffer baru yang dialokasikan dari memory pool saat membaca
+        before = pa.total_allocated_bytes()
+        read_table(self.ipc_path, self.csv_path)
+        self.assertEqual(pa.total_allocated_bytes(), before)
+
+    def test_dataframe_matches_read_csv(self):
+        """Test DataFrame hasil memory-map sama dengan hasil pd.read_csv."""
+        df = read_dataframe(self.ipc_path, self.csv_path)
+        self.assertIsInstance(df["Title"].dtype, pd.ArrowDtype)
+        pd.testing.assert_frame_equal(as_python(df), as_python(pd.read_csv(self.csv_path)))
+
+    def test_transform_output_matches_csv_input(self):
+        """Test hasil transformasi dari Arrow IPC sama dengan dari CSV."""
+        expected = transform_data(pd.read_csv(self.csv_path), RATES)
+        result = transform_data(read_dataframe(self.ipc_path, self.csv_path), RATES)
+        pd.testing.assert_frame_equal(as_python(result), as_python(expected))
+
+        arrow_result = transform_table(read_table(self.ipc_path), RATES).to_pandas()
+        pd.testing.assert_frame_equal(as_python(arrow_result), as_python(expected))
+
+    def test_newer_csv_is_reconverted(self):
+        """Test CSV yang lebih baru dari file IPC dikonversi ulang."""
+        read_table(self.ipc_path, self.csv_path)
+        self.raw.iloc[:2].to_csv(self.csv_path, index=False)
+        future = time.time() + 10
+        os.utime(self.csv_path, (future, future))
+
+        self.assertEqual(read_table(self.ipc_path, self.csv_path).num_rows, 2)
+
+    def test_write_ipc_round_trip(self):
+        """Test write_ipc menulis file Arrow IPC yang dapat dibaca ulang."""
+        path = os.path.join(self.tmp.name, "clean.arrow")
+        write_ipc(self.raw, path)
+        self.assertEqual(read_dataframe(path).astype(object).iloc[0, 0], "T-shirt 1")
+        self.assertEqual(os.listdir(self.tmp.name).count("clean.arrow"), 1)
+
+    def test_missing_file_raises(self):
+        """Test file IPC yang tidak ada menghasilkan FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            read_table(os.path.join(self.tmp.name, "missing.arrow"))
+
+
+if __name__ == "__main__":
+    unittest.main()
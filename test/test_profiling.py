@@ -0,0 +1,158 @@
+"""
+Unit test untuk utils.profiling
+
+Memastikan sketsa dapat digabung, profil per potongan sama dengan profil
+sekali jalan, dan profil dapat disimpan serta dibandingkan antar run.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Tambahkan path root proyek agar bisa import dari utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.profiling import (
+    DataProfile, HyperLogLog, QuantileSketch, compare_profiles, latest_profile, read_profile
+)
+from utils.transform import transform_data, transform_chunks
+
+
+RATES = pd.DataFrame({
+    "Currency": ["USD", "IDR"],
+    "Rate": [16000.0, 1.0],
+    "Date": pd.to_datetime(["2025-01-01", "2025-01-01"]),
+})
+
+
+def make_raw(rows):
+    return pd.DataFrame({
+        "Title": [f"Item {i % 7}" for i in range(rows)],
+        "Price": [f"${(i % 7) + 1}.50" if i % 5 else "Price Unavailable" for i in range(rows)],
+        "Rating": [f"Rating: ⭐ {(i % 7) % 5 + 0.5} / 5" for i in range(rows)],
+        "Colour": ["3 Colors"] * rows,
+        "Size": ["Size: M" if i % 2 else "Size: L" for i in range(rows)],
+        "Gender": ["Gender: Men"] * rows,
+    })
+
+
+class TestSketches(unittest.TestCase):
+    """Kelas unit test untuk HyperLogLog dan QuantileSketch"""
+
+    def test_hyperloglog_estimates_and_merges(self):
+        """Test estimasi HyperLogLog akurat setelah digabung dan disimpan ulang."""
+        left, right = HyperLogLog(), HyperLogLog()
+        left.add(np.arange(0, 6000))
+        right.add(np.arange(4000, 10000))
+        left.merge(right)
+        self.assertAlmostEqual(left.count(), 10000, delta=10000 * 0.1)
+
+        restored = HyperLogLog.from_dict(left.to_dict())
+        self.assertEqual(restored.count(), left.count())
+
+    def test_hyperloglog_small_counts_are_exact_enough(self):
+        """Test jumlah nilai unik yang kecil dihitung tepat."""
+        hll = HyperLogLog()
+        hll.add(["a", "b", "c", "a", "b"])
+        self.assertEqual(hll.count(), 3)
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test kuantil sketsa gabungan berada dalam galat relatif yang ditentukan."""
+        values = np.random.default_rng(0).lognormal(3, 1, 20000)
+        sketch = QuantileSketch(accuracy=0.01)
+        for part in np.array_split(values, 4):
+            other = QuantileSketch(accuracy=0.01)
+            other.add(part)
+            sketch.merge(other)
+
+        for q in [0.1, 0.5, 0.9, 0.99]:
+            exact = np.quantile(values, q, method="lower")
+            self.assertAlmostEqual(sketch.quantile(q), exact, delta=exact * 0.02)
+
+    def test_quantiles_handle_zero_and_negative(self):
+        """Test sketsa kuantil menangani nol, nilai negatif, dan NaN."""
+        sketch = QuantileSketch()
+        sketch.add(np.array([-10.0, 0.0, 0.0, 10.0, np.nan]))
+        self.assertEqual(sketch.count, 4)
+        self.assertAlmostEqual(sketch.quantile(0.0), -10.0, delta=0.2)
+        self.assertEqual(sketch.quantile(0.5), 0.0)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+
+class TestDataProfile(unittest.TestCase):
+    """Kelas unit test untuk DataProfile"""
+
+    def test_profile_counts_rows_nulls_and_duplicates(self):
+        """Test profil menghitung baris, null, nilai invalid, kategori, dan duplikat."""
+        raw = make_raw(70)
+        raw.loc[0, "Title"] = None
+        profile = DataProfile()
+        clean = transform_data(raw, RATES, profile=profile)
+        result = profile.to_dict()
+
+        self.assertEqual(result["rows"]["raw"], 70)
+        self.assertEqual(result["rows"]["valid"], 56)
+        self.assertEqual(result["rows"]["dropped_invalid"], 14)
+        self.assertEqual(result["rows"]["output"], len(clean))
+        self.assertEqual(result["raw_columns"]["Title"]["nulls"], 1)
+        self.assertEqual(result["invalid_after_cleaning"]["Price"], 14)
+        self.assertEqual(result["numeric"]["Price"]["min"], clean["Price"].min())
+        self.assertEqual(result["numeric"]["Price"]["max"], clean["Price"].max())
+        self.assertEqual(sum(result["rating_histogram"]["counts"]), 56)
+        self.assertEqual(result["categories"]["Size"], {"M": 28, "L": 28})
+        expected_ratio = 1 - len(clean) / 56
+        self.assertAlmostEqual(result["duplicates"]["duplicate_ratio"], expected_ratio, places=2)
+
+    def test_chunked_profile_matches_single_pass(self):
+        """Test profil per potongan sama dengan profil sekali jalan."""
+        raw = make_raw(100)
+        whole = DataProfile()
+        expected = transform_data(raw, RATES, profile=whole)
+
+        chunked = DataProfile()
+        result = transform_chunks((raw.iloc[i:i + 30] for i in range(0, 100, 30)), RATES, profile=chunked)
+
+        pd.testing.assert_frame_equal(
+            result.drop(columns="Timestamp"), expected.drop(columns="Timestamp")
+        )
+        a, b = whole.to_dict(), chunked.to_dict()
+        self.assertEqual(a["rows"], b["rows"])
+        self.assertEqual(a["numeric"]["Price"]["p50"], b["numeric"]["Price"]["p50"])
+        self.assertEqual(a["duplicates"], b["duplicates"])
+
+    def test_merge_and_round_trip(self):
+        """Test profil dapat digabung, disimpan ke JSON, dan dibaca kembali."""
+        first, second = DataProfile(), DataProfile()
+        transform_data(make_raw(40), RATES, profile=first)
+        transform_data(make_raw(60), RATES, profile=second)
+        first.merge(second)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "run.json")
+            first.write(path)
+            restored = DataProfile.from_dict(read_profile(path))
+            self.assertEqual(restored.to_dict(), first.to_dict())
+            self.assertEqual(latest_profile(tmp)["rows"]["raw"], 100)
+        self.assertIsNone(latest_profile(os.path.join("missing", "dir")))
+
+    def test_compare_profiles_reports_changes(self):
+        """Test perbandingan profil melaporkan perubahan antar run."""
+        before, after = DataProfile(), DataProfile()
+        transform_data(make_raw(40), RATES, profile=before)
+        transform_data(make_raw(80), RATES, profile=after)
+
+        changes = compare_profiles(before.to_dict(), after.to_dict())
+        self.assertEqual(changes["rows.raw"], {"previous": 40, "current": 80, "change": 40})
+        self.assertIn("raw.Price.null_rate", changes)
+
+    def test_arrow_backend_rejects_profile(self):
+        """Test backend arrow menolak parameter profile."""
+        with self.assertRaises(ValueError):
+            transform_data(make_raw(10), RATES, backend="arrow", profile=DataProfile())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit test untuk utils/scheduler.py
+
+Menguji apakah:
+- Jadwal interval dan cron menghasilkan waktu run berikutnya yang benar
+- Endpoint /health dan /metrics melaporkan status run pipeline
+"""
+
+import unittest
+import os
+import sys
+import json
+import urllib.request
+import urllib.error
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.scheduler import CronSchedule, IntervalSchedule, PipelineMetrics, start_health_server
+
+
+class TestSchedules(unittest.TestCase):
+    def test_interval_schedule(self):
+        """Test jadwal interval menambah N detik."""
+        schedule = IntervalSchedule(90)
+        self.assertEqual(schedule.next_after(datetime(2025, 5, 16, 10, 0)), datetime(2025, 5, 16, 10, 1, 30))
+
+    def test_invalid_interval(self):
+        """Test interval nol ditolak."""
+        with self.assertRaises(ValueError):
+            IntervalSchedule(0)
+
+    def test_cron_every_six_hours(self):
+        """Test ekspresi cron langkah jam."""
+        schedule = CronSchedule("0 */6 * * *")
+        self.assertEqual(schedule.next_after(datetime(2025, 5, 16, 10, 30)), datetime(2025, 5, 16, 12, 0))
+        self.assertEqual(schedule.next_after(datetime(2025, 5, 16, 18, 0)), datetime(2025, 5, 17, 0, 0))
+
+    def test_cron_weekdays_only(self):
+        """Test cron hari kerja melewati akhir pekan."""
+        schedule = CronSchedule("30 8 * * 1-5")
+        # 17 Mei 2025 adalah hari Sabtu
+        self.assertEqual(schedule.next_after(datetime(2025, 5, 17, 9, 0)), datetime(2025, 5, 19, 8, 30))
+
+    def test_cron_day_or_weekday(self):
+        """Test tanggal dan hari yang sama-sama dibatasi cocok jika salah satunya cocok."""
+        schedule = CronSchedule("0 0 1 * 0")
+        # 18 Mei 2025 hari Minggu, lebih dulu dari tanggal 1 Juni
+        self.assertEqual(schedule.next_after(datetime(2025, 5, 16)), datetime(2025, 5, 18))
+
+    def test_invalid_cron(self):
+        """Test ekspresi cron tidak valid ditolak."""
+        for expression in ["* * * *", "61 * * * *", "0 0 31 2 *"]:
+            with self.assertRaises(ValueError):
+                CronSchedule(expression).next_after(datetime(2025, 1, 1))
+
+
+class TestHealthServer(unittest.TestCase):
+    def setUp(self):
+        self.metrics = PipelineMetrics()
+        self.server = start_health_server(self.metrics, port=0)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_health_ok_after_success(self):
+        """Test /health melaporkan ok setelah run sukses."""
+        self.metrics.run_finished(True, 1.5, items=10)
+        with urllib.request.urlopen(f"{self.base_url}/health") as response:
+            payload = json.loads(response.read())
+        self.assertEqual(payload["status"], "ok")
+        self.assertEqual(payload["last_status"], "success")
+
+    def test_health_failing_after_failure(self):
+        """Test /health mengembalikan 503 setelah run gagal."""
+        self.metrics.run_finished(False, 0.5)
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            urllib.request.urlopen(f"{self.base_url}/health")
+        self.assertEqual(ctx.exception.code, 503)
+
+    def test_metrics_endpoint(self):
+        """Test /metrics dalam format teks Prometheus."""
+        self.metrics.run_finished(True, 1.5, items=10)
+        self.metrics.run_finished(False, 0.5)
+        with urllib.request.urlopen(f"{self.base_url}/metrics") as response:
+            body = response.read().decode("utf-8")
+        self.assertIn('etl_runs_total{status="success"} 1', body)
+        self.assertIn('etl_runs_total{status="failed"} 1', body)
+        self.assertIn("etl_last_run_duration_seconds 0.5", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
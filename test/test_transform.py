@@ -9,11 +9,17 @@ import pandas as pd
 from datetime import datetime
 import os
 import sys
+import time
+import tempfile
+from unittest.mock import patch, MagicMock
 
 # Tambahkan path root proyek agar bisa import dari utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.transform import transform_data
+from utils.transform import (
+    transform_data, normalize_prices, load_exchange_rates,
+    TRANSFORM_RULES, register_rule, plan_transform, evaluate_columns, transform_fingerprint, clean_size
+)
 
 
 class TestTransformData(unittest.TestCase):
@@ -202,5 +208,159 @@ class TestTransformData(unittest.TestCase):
         self.assertIn("Timestamp", result.columns)
 
 
+
+class TestCurrencyConversion(unittest.TestCase):
+    """Kelas unit test untuk konversi harga multi mata uang"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.rate_file = os.path.join(self.tmp_dir.name, "rates.csv")
+        pd.DataFrame({
+            "Currency": ["USD", "USD", "EUR", "IDR"],
+            "Rate": [15000.0, 16000.0, 17500.0, 1.0],
+            "Date": ["2024-01-01", "2025-01-01", "2025-01-01", "2024-01-01"],
+        }).to_csv(self.rate_file, index=False)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_multiple_currencies_converted(self):
+        """Test konversi beberapa mata uang sekaligus."""
+        rates = load_exchange_rates(self.rate_file, ttl=0)
+        prices = pd.Series(["$10.00", "€2", "Rp 1,500", "£5", "$invalid", None])
+        result = normalize_prices(prices, rates, as_of="2025-06-01")
+
+        self.assertEqual(result["Price"].tolist()[:3], [160000.0, 35000.0, 1500.0])
+        self.assertTrue(result["Price"].iloc[3:].isna().all())  # GBP tanpa kurs, sisanya invalid
+        self.assertEqual(result["Currency"].tolist()[:4], ["USD", "EUR", "IDR", "GBP"])
+        self.assertEqual(result["Amount"].tolist()[:4], [10.0, 2.0, 1500.0, 5.0])
+
+    def test_repeated_prices_mapped_back_to_rows(self):
+        """Test harga unik di-parse sekali dan hasilnya kembali ke baris yang benar."""
+        rates = load_exchange_rates(self.rate_file, ttl=0)
+        prices = pd.Series(["€2", None, "$10.00", "€2", "$invalid", "$10.00", None], index=range(10, 17))
+        result = normalize_prices(prices, rates, as_of="2025-06-01")
+
+        self.assertEqual(result.index.tolist(), list(range(10, 17)))
+        expected = [35000.0, None, 160000.0, 35000.0, None, 160000.0, None]
+        self.assertEqual([None if pd.isna(v) else v for v in result["Price"]], expected)
+        self.assertEqual(result["Currency"].tolist()[2:4], ["USD", "EUR"])
+        self.assertTrue(pd.isna(result["Currency"].iloc[1]))
+
+    def test_dated_rates_use_rate_valid_on_date(self):
+        """Test kurs yang dipakai adalah kurs terbaru pada tanggal acuan."""
+        rates = load_exchange_rates(self.rate_file, ttl=0)
+        result = normalize_prices(pd.Series(["$1"]), rates, as_of="2024-06-01")
+        self.assertEqual(result["Price"].iloc[0], 15000.0)
+
+    def test_rates_cached_until_ttl(self):
+        """Test tabel kurs dibaca ulang dari file hanya setelah TTL habis."""
+        load_exchange_rates(self.rate_file, ttl=0)
+        with patch("utils.transform.pd.read_csv") as mock_read:
+            load_exchange_rates(self.rate_file, ttl=3600)
+            mock_read.assert_not_called()
+
+    def test_transform_keeps_original_amount_and_currency(self):
+        """Test transform_data menyimpan kolom Amount dan Currency asli."""
+        raw = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2"],
+            "Price": ["$10.00", "€2.00"],
+            "Rating": ["Rating: ⭐ 4.5 / 5", "Rating: ⭐ 3.5 / 5"],
+            "Colour": ["3 Colors", "2 Colors"],
+            "Size": ["Size: S", "Size: M"],
+            "Gender": ["Gender: Men", "Gender: Women"],
+        })
+        rates = load_exchange_rates(self.rate_file, ttl=0)
+        result = transform_data(raw, rates=rates, as_of="2025-06-01")
+
+        self.assertEqual(result["Price"].tolist(), [160000.0, 35000.0])
+        self.assertEqual(result["Amount"].tolist(), [10.0, 2.0])
+        self.assertEqual(result["Currency"].tolist(), ["USD", "EUR"])
+
+
+
+class TestTransformPlan(unittest.TestCase):
+    """Kelas unit test untuk registry aturan dan evaluasi kolom secara lazy"""
+
+    def setUp(self):
+        """Gunakan data dummy yang sama dengan TestTransformData."""
+        TestTransformData.setUp(self)
+
+    def test_plan_only_includes_needed_rules(self):
+        """Test bahwa kolom yang tidak diminta tidak dihitung."""
+        names = [rule.name for rule in plan_transform(["Title", "Size", "Price", "Rating", "Colour"])]
+        self.assertNotIn("clean_gender", names)
+        self.assertIn("clean_size", names)
+
+    def test_elementwise_rule_called_once_per_distinct_value(self):
+        """Test bahwa aturan elementwise satu input dipanggil sekali per nilai unik."""
+        raw = pd.concat([self.raw_data] * 50, ignore_index=True)
+        mock_size = MagicMock(side_effect=clean_size)
+        with patch.dict(TRANSFORM_RULES):
+            register_rule(["Size"], ["Size"], mock_size, elementwise=True, dtype=str)
+            result = evaluate_columns(raw, ["Size"])
+
+        self.assertEqual(mock_size.call_count, raw["Size"].nunique(dropna=False))
+        self.assertEqual(result["Size"].tolist(), raw["Size"].apply(clean_size).tolist())
+
+    def test_elementwise_rules_faster_than_apply(self):
+        """Test bahwa evaluasi aturan elementwise tidak lebih lambat dari .apply per kolom."""
+        raw = pd.concat([self.raw_data] * 20000, ignore_index=True)
+        columns = ["Rating", "Colour", "Size", "Gender"]
+
+        def best(func):
+            timings = []
+            for _ in range(3):
+                started = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        rules_time = best(lambda: evaluate_columns(raw, columns))
+        apply_time = best(lambda: [raw[col].apply(TRANSFORM_RULES[col].func) for col in columns])
+        self.assertLess(rules_time, apply_time)
+
+    def test_requested_columns_only(self):
+        """Test bahwa hanya kolom yang diminta dikembalikan."""
+        result = transform_data(self.raw_data, columns=["Title", "Size"])
+        self.assertEqual(list(result.columns), ["Title", "Size"])
+        self.assertEqual(result["Size"].tolist(), ["S", "L"])
+
+    def test_unknown_column_raises_error(self):
+        """Test bahwa kolom yang tidak dikenal menghasilkan error."""
+        with self.assertRaises(KeyError):
+            transform_data(self.raw_data, columns=["Title", "Discount"])
+
+    def test_rule_with_dependency(self):
+        """Test aturan baru yang bergantung pada kolom turunan lain."""
+        with patch.dict(TRANSFORM_RULES):
+            register_rule(
+                ["Label"], ["Title"], lambda title, size: f"{title} ({size})",
+                elementwise=True, requires=["Size"]
+            )
+            plan = plan_transform(["Label"])
+            self.assertEqual([rule.name for rule in plan], ["clean_size", "<lambda>"])
+
+            result = transform_data(self.raw_data, columns=["Title", "Label"])
+            self.assertEqual(result["Label"].tolist(), ["T-shirt 1 (S)", "Duplicate Item (L)"])
+
+    def test_fingerprint_tracks_rule_registry(self):
+        """Test fingerprint transformasi berubah jika aturan ditambah atau diganti."""
+        baseline = transform_fingerprint()
+        self.assertEqual(transform_fingerprint(), baseline)
+
+        with patch.dict(TRANSFORM_RULES):
+            register_rule(["Label"], ["Title"], str.upper, elementwise=True)
+            self.assertNotEqual(transform_fingerprint(), baseline)
+
+        with patch.dict(TRANSFORM_RULES):
+            register_rule(["Rating"], ["Rating"], lambda value: 5.0, elementwise=True)
+            self.assertNotEqual(transform_fingerprint(), baseline)
+
+        self.assertEqual(transform_fingerprint(), baseline)
+        with patch("utils.transform.TRANSFORM_VERSION", 999):
+            self.assertNotEqual(transform_fingerprint(), baseline)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Unit test untuk utils.transform_arrow
+
+Memastikan backend arrow menghasilkan data yang sama dengan backend pandas
+(acuan) untuk berbagai variasi data mentah.
+"""
+
+import unittest
+import os
+import sys
+import pandas as pd
+import pyarrow as pa
+
+# Tambahkan path root proyek agar bisa import dari utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.transform import transform_data
+from utils.transform_arrow import transform_table
+
+
+RATES = pd.DataFrame({
+    "Currency": ["USD", "EUR", "IDR"],
+    "Rate": [16000.0, 17500.0, 1.0],
+    "Date": pd.to_datetime(["2025-01-01", "2025-01-01", "2025-01-01"]),
+})
+
+
+class TestArrowParity(unittest.TestCase):
+    """Kelas unit test paritas backend arrow terhadap backend pandas"""
+
+    def setUp(self):
+        self.raw_data = pd.DataFrame({
+            "Title": ["T-shirt 1", "Dress 2", "Pants 3", "Unknown Product", "T-shirt 1", "Jacket 6", None],
+            "Price": ["$10.99", "$unavailable", "€20", "$50.00", "$10.99", "Rp 1,500", "$5"],
+            "Rating": [
+                "Rating: ⭐ 4.5 / 5",
+                "Rating: Not Rated",
+                "Rating: ⭐ 7 / 3.5",
+                "Rating: ⭐ Invalid Rating / 5",
+                "Rating: ⭐ 4.5 / 5",
+                "Rating: ⭐ 1e0 / 5",
+                None,
+            ],
+            "Colour": ["3 Colors", "Red Color", "5 Colors", "No Color", "3 Colors", "Colors 8", "2 Colors"],
+            "Size": ["Size: S", "Size: XL", None, "", "Size: S", " Size: M ", "Size: L"],
+            "Gender": ["Gender: Men", "Gender: Women", "Gender: Unisex", None, "Gender: Men", "Women", "Gender: Men"],
+        })
+
+    def assert_parity(self, raw):
+        expected = transform_data(raw, rates=RATES, as_of="2025-06-01").drop(columns="Timestamp")
+        actual = transform_data(raw, rates=RATES, as_of="2025-06-01", backend="arrow").drop(columns="Timestamp")
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_parity_with_pandas(self):
+        """Test hasil backend arrow sama dengan backend pandas."""
+        self.assert_parity(self.raw_data)
+
+    def test_parity_all_valid_rows(self):
+        """Test paritas tipe data Colour saat semua baris valid."""
+        self.assert_parity(self.raw_data.iloc[[0, 2, 5]].reset_index(drop=True))
+
+    def test_parity_with_extra_columns(self):
+        """Test kolom tambahan diteruskan dan ikut dalam penghapusan duplikat."""
+        extra = self.raw_data.copy()
+        extra["Extra Column"] = ["a", "b", "c", "d", "e", "f", "g"]
+        self.assert_parity(extra)
+
+    def test_parity_empty_dataframe(self):
+        """Test paritas untuk input kosong."""
+        result = transform_data(self.raw_data.iloc[0:0], rates=RATES, backend="arrow")
+        self.assertTrue(result.empty)
+        self.assertIn("Timestamp", result.columns)
+
+    def test_accepts_and_returns_arrow_table(self):
+        """Test transform_table menerima dan mengembalikan pyarrow.Table."""
+        table = pa.Table.from_pandas(self.raw_data, preserve_index=False)
+        result = transform_table(table, rates=RATES, as_of="2025-06-01")
+        self.assertIsInstance(result, pa.Table)
+        self.assertEqual(result.column_names[-1], "Timestamp")
+
+    def test_unknown_backend_raises_error(self):
+        """Test backend yang tidak dikenal menghasilkan error."""
+        with self.assertRaises(ValueError):
+            transform_data(self.raw_data, backend="polars")
+
+
+if __name__ == "__main__":
+    unittest.main()
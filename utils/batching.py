@@ -0,0 +1,151 @@
+"""
+Modul Batching dengan Antrian Terbatas
+
+Mengalirkan data ke satu destinasi dalam batch berukuran tetap melalui
+antrian terbatas (bounded queue):
+- Producer berhenti menunggu saat antrian penuh (backpressure), sehingga
+  jumlah batch di memori tidak bertambah seiring besarnya katalog
+- Batch yang gagal dicoba ulang sendiri-sendiri, tanpa mengulang seluruh load
+- Throughput, kedalaman antrian, dan waktu tunggu producer dilaporkan
+
+Destinasi diwakili objek "sink" dengan tiga method:
+    open()            dipanggil sekali sebelum batch pertama
+    write(batch)      menulis satu batch; boleh dipanggil ulang untuk batch yang sama
+    close(success)    menyelesaikan (commit) atau membatalkan load
+"""
+
+import time
+import queue
+import logging
+import threading
+import pandas as pd
+
+
+# Konfigurasi logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+DEFAULT_QUEUE_SIZE = 4        # Batch maksimal yang menunggu di antrian
+DEFAULT_MAX_RETRIES = 3       # Percobaan ulang per batch
+DEFAULT_RETRY_BACKOFF = 0.5   # Detik, dikali dua tiap percobaan ulang
+
+_END = object()
+
+
+def iter_batches(df: pd.DataFrame, batch_size: int):
+    """Memotong DataFrame menjadi batch `batch_size` baris (view, bukan salinan)"""
+    if batch_size < 1:
+        raise ValueError("batch_size harus lebih dari 0")
+    for start in range(0, len(df), batch_size):
+        yield df.iloc[start:start + batch_size]
+
+
+def _produce(batches, buffer: queue.Queue, stop: threading.Event, stats: dict):
+    """Memasukkan batch ke antrian; menunggu saat antrian penuh"""
+    try:
+        for batch in batches:
+            waited = time.monotonic()
+            while not stop.is_set():
+                try:
+                    buffer.put(batch, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            stats["producer_wait_seconds"] += time.monotonic() - waited
+            if stop.is_set():
+                return
+            stats["max_queue_depth"] = max(stats["max_queue_depth"], buffer.qsize())
+        item = _END
+    except Exception as e:
+        item = e
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def run_batched(name: str, batches, sink, queue_size: int = DEFAULT_QUEUE_SIZE,
+                max_retries: int = DEFAULT_MAX_RETRIES, retry_backoff: float = DEFAULT_RETRY_BACKOFF) -> dict:
+    """
+    Mengalirkan batch ke sink melalui antrian terbatas.
+
+    Args:
+        name (str): Nama destinasi untuk log.
+        batches: Iterable DataFrame (lihat iter_batches).
+        sink: Objek dengan method open(), write(batch), dan close(success).
+        queue_size (int): Kapasitas antrian antara producer dan sink.
+        max_retries (int): Percobaan ulang untuk tiap batch yang gagal.
+        retry_backoff (float): Jeda awal (detik) sebelum percobaan ulang.
+
+    Returns:
+        dict: Statistik load: success, rows, batches, retries, failed_batch,
+        seconds, rows_per_second, max_queue_depth, producer_wait_seconds,
+        dan error jika gagal.
+    """
+    stats = {
+        "success": False, "rows": 0, "batches": 0, "retries": 0, "failed_batch": None,
+        "seconds": 0.0, "rows_per_second": 0.0, "max_queue_depth": 0, "producer_wait_seconds": 0.0,
+    }
+    buffer = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    producer = threading.Thread(target=_produce, args=(batches, buffer, stop, stats), daemon=True)
+    started = time.monotonic()
+    opened = False
+
+    try:
+        sink.open()
+        opened = True
+        producer.start()
+        while True:
+            batch = buffer.get()
+            if batch is _END:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+
+            for attempt in range(max_retries + 1):
+                try:
+                    sink.write(batch)
+                    break
+                except Exception as e:
+                    if attempt == max_retries:
+                        stats["failed_batch"] = stats["batches"]
+                        raise
+                    stats["retries"] += 1
+                    logging.warning(
+                        f"{name}: batch {stats['batches']} gagal ({e}), "
+                        f"percobaan ulang {attempt + 1}/{max_retries}"
+                    )
+                    time.sleep(retry_backoff * 2 ** attempt)
+            stats["batches"] += 1
+            stats["rows"] += len(batch)
+
+        # Sink membersihkan sumber dayanya sendiri jika close(True) gagal
+        opened = False
+        sink.close(True)
+        stats["success"] = True
+    except Exception as e:
+        stats["error"] = str(e)
+        logging.error(f"{name}: load dibatalkan: {e}")
+        if opened:
+            try:
+                sink.close(False)
+            except Exception as close_error:
+                logging.error(f"{name}: gagal membatalkan load: {close_error}")
+    finally:
+        stop.set()
+        if producer.is_alive():
+            producer.join()
+
+    stats["seconds"] = time.monotonic() - started
+    stats["rows_per_second"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+    logging.info(
+        f"{name}: {stats['rows']} baris dalam {stats['batches']} batch, "
+        f"{stats['rows_per_second']:.0f} baris/detik, kedalaman antrian maks {stats['max_queue_depth']}, "
+        f"producer menunggu {stats['producer_wait_seconds']:.2f} detik, {stats['retries']} percobaan ulang"
+    )
+    return stats
@@ -0,0 +1,181 @@
+"""
+Modul Checkpoint Pipeline
+
+Menyimpan output tiap tahap ETL (extract, transform, load) agar run yang
+gagal dapat dilanjutkan tanpa scraping dan transformasi ulang:
+- Output tahap disimpan dalam format Feather (Arrow IPC, biner)
+- Tiap tahap dicatat di manifest JSON per run ID beserta fingerprint input
+- Tahap dengan fingerprint input yang sama dapat dilewati
+- Hanya CHECKPOINT_KEEP_RUNS run terbaru yang disimpan (lihat prune)
+"""
+
+import os
+import json
+import uuid
+import shutil
+import hashlib
+import logging
+from datetime import datetime
+import pandas as pd
+
+
+# Konfigurasi logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+CHECKPOINT_DIR = os.path.join(os.path.dirname(__file__), "..", ".checkpoints")
+CHECKPOINT_KEEP_RUNS = 20  # Run lama di luar batas ini dihapus oleh prune()
+
+
+def fingerprint_dataframe(df: pd.DataFrame) -> str:
+    """Menghitung fingerprint isi DataFrame (nama kolom, tipe data, dan nilai)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint_value(*parts) -> str:
+    """Menghitung fingerprint dari nilai konfigurasi atau fingerprint lain"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Penyimpanan checkpoint berbasis folder:
+
+        <root>/<run_id>/manifest.json
+        <root>/<run_id>/<stage>.feather
+    """
+
+    def __init__(self, root: str = CHECKPOINT_DIR, keep_runs: int = CHECKPOINT_KEEP_RUNS):
+        if keep_runs < 1:
+            raise ValueError("keep_runs harus minimal 1")
+        self.root = root
+        self.keep_runs = keep_runs
+
+    @staticmethod
+    def new_run_id() -> str:
+        """Membuat run ID baru yang terurut berdasarkan waktu"""
+        return f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{uuid.uuid4().hex[:6]}"
+
+    def _run_dir(self, run_id: str) -> str:
+        return os.path.join(self.root, run_id)
+
+    def read_manifest(self, run_id: str) -> dict:
+        """Membaca manifest run; manifest kosong jika run belum ada"""
+        path = os.path.join(self._run_dir(run_id), "manifest.json")
+        try:
+            with open(path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {"run_id": run_id, "status": "new", "stages": {}}
+
+    def _write_manifest(self, run_id: str, manifest: dict):
+        run_dir = self._run_dir(run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        path = os.path.join(run_dir, "manifest.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
+        os.replace(tmp_path, path)
+
+    def set_run_status(self, run_id: str, status: str):
+        """Mengubah status run (running, failed, completed)"""
+        manifest = self.read_manifest(run_id)
+        manifest["status"] = status
+        manifest["updated"] = datetime.now().isoformat(timespec="seconds")
+        self._write_manifest(run_id, manifest)
+
+    def mark_stage(self, run_id: str, stage: str, status: str, fingerprint: str = None, **extra):
+        """Mencatat status tahap beserta fingerprint inputnya di manifest"""
+        manifest = self.read_manifest(run_id)
+        entry = manifest["stages"].get(stage, {})
+        entry.update(extra, status=status, updated=datetime.now().isoformat(timespec="seconds"))
+        if fingerprint is not None:
+            entry["fingerprint"] = fingerprint
+        manifest["stages"][stage] = entry
+        self._write_manifest(run_id, manifest)
+
+    def save_stage(self, run_id: str, stage: str, df: pd.DataFrame, fingerprint: str) -> str:
+        """Menyimpan output tahap ke Feather lalu menandai tahap selesai"""
+        run_dir = self._run_dir(run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        path = os.path.join(run_dir, f"{stage}.feather")
+        tmp_path = f"{path}.tmp"
+        df.reset_index(drop=True).to_feather(tmp_path)
+        os.replace(tmp_path, path)
+        self.mark_stage(
+            run_id, stage, "completed", fingerprint,
+            file=os.path.basename(path), rows=len(df), output=fingerprint_dataframe(df)
+        )
+        return path
+
+    def stage_done(self, run_id: str, stage: str, fingerprint: str) -> bool:
+        """True jika tahap sudah selesai di run ini dengan fingerprint input yang sama"""
+        entry = self.read_manifest(run_id)["stages"].get(stage, {})
+        return entry.get("status") == "completed" and entry.get("fingerprint") == fingerprint
+
+    def load_stage(self, run_id: str, stage: str, fingerprint: str, any_run: bool = True):
+        """
+        Memuat output tahap yang inputnya tidak berubah.
+
+        Run ini diperiksa lebih dulu, lalu (jika `any_run`) run lain dari yang
+        terbaru. Tahap yang hasilnya bergantung pada waktu, seperti extract,
+        sebaiknya hanya dimuat dari run yang sama (`any_run=False`).
+
+        Returns:
+            pd.DataFrame atau None jika tidak ada checkpoint yang cocok.
+        """
+        candidates = [run_id]
+        if any_run:
+            candidates += [rid for rid in reversed(self.list_runs()) if rid != run_id]
+        for candidate in candidates:
+            entry = self.read_manifest(candidate)["stages"].get(stage, {})
+            if entry.get("status") != "completed" or entry.get("fingerprint") != fingerprint:
+                continue
+            path = os.path.join(self._run_dir(candidate), entry.get("file", ""))
+            if entry.get("file") and os.path.exists(path):
+                logging.info(f"Memakai checkpoint tahap {stage} dari run {candidate}")
+                return pd.read_feather(path)
+        return None
+
+    def list_runs(self) -> list:
+        """Daftar run ID yang tersimpan, dari yang terlama"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if os.path.exists(os.path.join(self.root, name, "manifest.json"))
+        )
+
+    def prune(self, exclude=()) -> list:
+        """
+        Menghapus run terlama sehingga hanya `keep_runs` run terbaru yang
+        tersisa. Run di `exclude` (mis. run yang sedang berjalan) tidak dihapus.
+
+        Returns:
+            list: Run ID yang dihapus.
+        """
+        runs = self.list_runs()
+        removed = []
+        for run_id in runs[:max(0, len(runs) - self.keep_runs)]:
+            if run_id in exclude:
+                continue
+            try:
+                shutil.rmtree(self._run_dir(run_id))
+                removed.append(run_id)
+            except OSError as e:
+                logging.warning(f"Gagal menghapus checkpoint run {run_id}: {e}")
+        if removed:
+            logging.info(f"{len(removed)} checkpoint run lama dihapus")
+        return removed
+
+    def latest_incomplete_run(self):
+        """Run terbaru yang belum selesai (gagal/terhenti), atau None"""
+        runs = self.list_runs()
+        if runs and self.read_manifest(runs[-1])["status"] != "completed":
+            return runs[-1]
+        return None
@@ -1,9 +1,139 @@
+import os
+import sys
+import time
 import logging
 import pandas as pd
-from scrapy import Spider, Request
+from scrapy import Spider, Request, signals
 from scrapy.crawler import CrawlerProcess
+from scrapy.utils.httpobj import urlparse_cached
 from datetime import datetime
 
+if __name__ == "__main__":
+    # Dijalankan langsung (python utils/extract.py): tambahkan root proyek agar paket utils
+    # dapat diimpor. Saat diimpor sebagai modul, sys.path pemanggil tidak diubah.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.mmap_io import RAW_DATA_ARROW, RAW_DATA_CSV, read_dataframe
+
+
+class TokenBucket:
+    """Token bucket untuk membatasi laju request ke satu host"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = None
+
+    def reserve(self, now: float) -> float:
+        """Memesan satu token dan mengembalikan waktu tunggu (detik) sebelum boleh dipakai"""
+        if self.updated is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class AdaptivePolitenessMiddleware:
+    """
+    Downloader middleware untuk crawling yang sopan namun tetap cepat:
+    - rate limit token bucket per host
+    - retry respons 429/503 dengan backoff eksponensial (menghormati Retry-After)
+    - laju per host naik perlahan saat sukses dan turun setengah saat ditolak (AIMD)
+    - melaporkan request/detik yang tercapai ke stats crawler
+    """
+
+    def __init__(self, stats, rate=8.0, burst=8.0, min_rate=1.0, max_rate=20.0, rate_step=0.25,
+                 retry_codes=(429, 503), max_retries=5, backoff_base=1.0, backoff_max=30.0):
+        self.stats = stats
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_step = rate_step
+        self.retry_codes = set(retry_codes)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.buckets = {}
+        self.blocked_until = {}
+        self.started = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        middleware = cls(
+            crawler.stats,
+            rate=settings.getfloat("POLITENESS_RATE", 8.0),
+            burst=settings.getfloat("POLITENESS_BURST", 8.0),
+            min_rate=settings.getfloat("POLITENESS_MIN_RATE", 1.0),
+            max_rate=settings.getfloat("POLITENESS_MAX_RATE", 20.0),
+            rate_step=settings.getfloat("POLITENESS_RATE_STEP", 0.25),
+            retry_codes=[int(code) for code in settings.getlist("POLITENESS_RETRY_CODES", [429, 503])],
+            max_retries=settings.getint("POLITENESS_MAX_RETRIES", 5),
+            backoff_base=settings.getfloat("POLITENESS_BACKOFF_BASE", 1.0),
+            backoff_max=settings.getfloat("POLITENESS_BACKOFF_MAX", 30.0),
+        )
+        crawler.signals.connect(middleware.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def _bucket(self, host):
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    def spider_opened(self, spider):
+        self.started = time.monotonic()
+
+    def spider_closed(self, spider):
+        elapsed = time.monotonic() - (self.started or time.monotonic())
+        responses = self.stats.get_value("politeness/responses", 0)
+        rps = responses / elapsed if elapsed > 0 else 0.0
+        self.stats.set_value("politeness/requests_per_second", round(rps, 2))
+        logging.info(f"Throughput crawling: {rps:.2f} request/detik ({responses} respons)")
+
+    def process_request(self, request, spider):
+        """Menunda request jika token host habis atau host sedang dalam backoff"""
+        host = urlparse_cached(request).hostname
+        now = time.monotonic()
+        delay = self._bucket(host).reserve(now)
+        delay = max(delay, self.blocked_until.get(host, 0.0) - now)
+        if delay > 0:
+            from twisted.internet import reactor
+            from twisted.internet.task import deferLater
+            self.stats.inc_value("politeness/delayed_requests")
+            return deferLater(reactor, delay, lambda: None)
+        return None
+
+    def process_response(self, request, response, spider):
+        """Menyesuaikan laju host dan menjadwalkan ulang respons 429/503"""
+        host = urlparse_cached(request).hostname
+        bucket = self._bucket(host)
+        self.stats.inc_value("politeness/responses")
+
+        if response.status not in self.retry_codes:
+            bucket.rate = min(self.max_rate, bucket.rate + self.rate_step)
+            return response
+
+        bucket.rate = max(self.min_rate, bucket.rate / 2)
+        self.stats.inc_value(f"politeness/status_{response.status}")
+        retries = request.meta.get("politeness_retries", 0)
+        if retries >= self.max_retries:
+            logging.warning(f"Menyerah setelah {retries} retry: {request.url}")
+            return response
+
+        backoff = min(self.backoff_max, self.backoff_base * (2 ** retries))
+        retry_after = response.headers.get(b"Retry-After")
+        if retry_after and retry_after.strip().isdigit():
+            backoff = min(self.backoff_max, max(backoff, float(retry_after)))
+        self.blocked_until[host] = max(self.blocked_until.get(host, 0.0), time.monotonic() + backoff)
+        self.stats.inc_value("politeness/retries")
+
+        retry_request = request.copy()
+        retry_request.meta["politeness_retries"] = retries + 1
+        retry_request.dont_filter = True
+        return retry_request
+
 
 class FashionSpider(Spider):
     """Spider untuk mengambil data fashion dari halaman web"""
@@ -15,8 +145,24 @@ class FashionSpider(Spider):
         'USER_AGENT': 'FashionDataCollectorBot/1.0',
         'LOG_LEVEL': 'INFO',
         'FEED_FORMAT': 'csv',
-        'FEED_URI': 'data_scrapping.csv',  # Menyimpan langsung dalam format file CSV
+        'FEED_URI': RAW_DATA_CSV,  # Menyimpan langsung dalam format file CSV
         'CLOSESPIDER_ITEMCOUNT': 1000,     # Tutup setelah 1000 item (sesuai dengan rubrik penilaian)
+
+        # Profil crawling: konkurensi diatur AutoThrottle berdasarkan latensi,
+        # laju per host dibatasi token bucket AdaptivePolitenessMiddleware
+        'CONCURRENT_REQUESTS': 16,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        'DOWNLOAD_DELAY': 0,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 0.25,
+        'AUTOTHROTTLE_MAX_DELAY': 10.0,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+        'POLITENESS_RATE': 8.0,             # request/detik awal per host
+        'POLITENESS_BURST': 8.0,
+        'POLITENESS_MAX_RETRIES': 5,
+        'POLITENESS_BACKOFF_BASE': 1.0,
+        'RETRY_HTTP_CODES': [500, 502, 504, 522, 524, 408],  # 429/503 ditangani middleware
+        'DOWNLOADER_MIDDLEWARES': {AdaptivePolitenessMiddleware: 560},
     }
 
     def parse(self, response):
@@ -41,13 +187,16 @@ class FashionSpider(Spider):
 def eksekusi_pengambilan_data():
     """
     Fungsi utama untuk menjalankan proses pengambilan data
+
+    Hasil scraping dikonversi ke Arrow IPC lalu dibaca dengan memory-map,
+    sehingga kolom DataFrame merujuk langsung ke file di disk.
     """
     try:
         process = CrawlerProcess()
         process.crawl(FashionSpider)
         process.start()
 
-        df = pd.read_csv("data_scrapping.csv")
+        df = read_dataframe(RAW_DATA_ARROW, RAW_DATA_CSV)
         return df
 
     except Exception as e:
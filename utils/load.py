@@ -5,17 +5,36 @@ Menyimpan data hasil transformasi ke:
 - CSV (flat file)
 - Google Sheets
 - PostgreSQL
+- SQLite (database lokal tanpa server)
+
+Dengan load_data(batched=True) tiap destinasi dimuat paralel dalam batch
+berukuran tetap melalui antrian terbatas (utils.batching).
 """
 
 import os
+import io
+import sys
+import gzip
 import logging
+import sqlite3
+import tempfile
+import uuid
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 import pandas as pd
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text, table, column, insert
 from sqlalchemy.exc import SQLAlchemyError
 
+if __name__ == "__main__":
+    # Dijalankan langsung (python utils/load.py): tambahkan root proyek agar paket utils
+    # dapat diimpor. Saat diimpor sebagai modul, sys.path pemanggil tidak diubah.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.batching import DEFAULT_MAX_RETRIES, DEFAULT_QUEUE_SIZE, iter_batches, run_batched
+
 
 # Konfigurasi logging
 logging.basicConfig(
@@ -27,30 +46,367 @@ logging.basicConfig(
 SERVICE_ACCOUNT_FILE = "censored.json"
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets "]
 SPREADSHEET_ID = "censored"
-SHEET_RANGE = "Sheet1!A1:G1000"
+SHEET_RANGE = "Sheet1!A1:I1000"
+SHEET_NAME = "Sheet1"
+SHEET_ID = 0  # gid Sheet1, dipakai untuk request hapus baris
+SHEETS_KEY_COLUMNS = ["Title", "Size", "Gender", "Colour"]
+SHEETS_IGNORE_COLUMNS = ["Timestamp"]  # Tidak dibandingkan saat sinkronisasi diff
+
+# Cache isi sheet terakhir yang disinkronkan: spreadsheet_id -> list baris
+_sheet_cache = {}
+
+# Client dan koneksi yang dipakai ulang antar run dalam satu proses (mode daemon)
+_sheets_service = None
+_engine_cache = {}
+
+# Konfigurasi penulisan CSV
+CSV_CHUNK_ROWS = 50_000
+CSV_BUFFER_SIZE = 1024 * 1024
+CSV_EXTENSIONS = {None: ".csv", "gzip": ".csv.gz", "zstd": ".csv.zst"}
+
+# Konfigurasi skema PostgreSQL (dikelola loader, bukan ditebak to_sql)
+POSTGRES_COLUMNS = [
+    ("Title", "TEXT"),
+    ("Price", "NUMERIC(14, 2) NOT NULL"),
+    ("Rating", "REAL NOT NULL"),
+    ("Colour", "SMALLINT NOT NULL"),
+    ("Size", "TEXT NOT NULL"),    # Teks bebas hasil scraping: tanpa batas panjang
+    ("Gender", "TEXT NOT NULL"),
+    ("Amount", "NUMERIC(14, 2)"),
+    ("Currency", "CHAR(3)"),
+    ("Timestamp", "TIMESTAMP"),
+]
+POSTGRES_INDEX_COLUMNS = ["Gender", "Size", "Price"]
+POSTGRES_INSERT_CHUNK = 5_000
+POSTGRES_BULK_THRESHOLD = 10_000    # Di atas ini indeks dibangun setelah insert (tanpa partisi)
+POSTGRES_ANALYZE_THRESHOLD = 1_000  # Jumlah baris berubah sebelum ANALYZE
+
+# Konfigurasi database lokal
+LOCAL_DB_FILE = "fashion_products.db"
+LOCAL_DB_INDEX_COLUMNS = ["Title", "Gender", "Size"]
+LOCAL_DB_CHUNK_ROWS = 10_000
+
+# Konfigurasi load bertahap (batch) per destinasi
+LOAD_BATCH_SIZES = {
+    "csv": 50_000,
+    "google_sheets": 1_000,   # Satu request API per batch
+    "postgresql": 5_000,
+    "sqlite": 10_000,
+}
+LOAD_DEFAULT_BATCH_SIZE = 5_000
+
+
+@contextmanager
+def atomic_csv_writer(output_path: str, compression: str = None):
+    """
+    Membuka file sementara di folder tujuan lalu me-rename ke `output_path`
+    secara atomik setelah semua data selesai ditulis.
+
+    Jika terjadi error di tengah penulisan, file sementara dihapus dan file
+    tujuan yang lama tidak tersentuh.
+    """
+    if compression not in CSV_EXTENSIONS:
+        raise ValueError(f"Kompresi tidak didukung: {compression}")
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(output_path)}.", suffix=".tmp"
+    )
+    try:
+        with open(fd, "wb", buffering=CSV_BUFFER_SIZE) as raw:
+            if compression == "gzip":
+                binary = gzip.GzipFile(fileobj=raw, mode="wb")
+            elif compression == "zstd":
+                import zstandard
+                binary = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+            else:
+                binary = raw
+            text = io.TextIOWrapper(binary, encoding="utf-8", newline="")
+            try:
+                yield text
+                text.flush()
+            finally:
+                # Lepaskan wrapper agar kompresor ditutup lebih dulu dari file mentah
+                text.detach()
+                if binary is not raw:
+                    binary.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_csv_chunks(df: pd.DataFrame, handle, chunksize: int = CSV_CHUNK_ROWS, header: bool = True):
+    """Menulis DataFrame ke handle teks per potongan `chunksize` baris."""
+    if df.empty:
+        if header:
+            df.to_csv(handle, index=False)
+        return
+    for start in range(0, len(df), chunksize):
+        df.iloc[start:start + chunksize].to_csv(
+            handle, index=False, header=header and start == 0
+        )
+
+
+def _partition_label(value) -> str:
+    """Mengubah nilai partisi menjadi nama file yang aman."""
+    label = "__null__" if pd.isna(value) else str(value)
+    return "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in label)
 
 
-def save_to_csv(df: pd.DataFrame, output_file: str):
+def save_to_csv(df: pd.DataFrame, output_file: str, compression: str = None,
+                partition_by: str = None, chunksize: int = CSV_CHUNK_ROWS, part_name: str = None):
     """
     Menyimpan DataFrame ke file CSV.
+
+    Data ditulis bertahap ke file sementara lalu di-rename secara atomik,
+    sehingga pembaca tidak pernah melihat file yang terpotong.
+
+    Args:
+        compression: None, "gzip", atau "zstd" (membutuhkan paket zstandard).
+        partition_by: Jika diisi, `output_file` diperlakukan sebagai folder dan
+            baris tiap nilai kolom ini ditambahkan sebagai file baru
+            `<kolom>=<nilai>/part-<run>.csv`. File part lama tidak disentuh,
+            sehingga run inkremental menambah baris ke partisi yang sudah ada.
+        part_name: Nama file part (tanpa ekstensi) untuk load berpartisi;
+            default `part-<waktu>-<id acak>`. Nama yang sama menimpa part
+            tersebut, sehingga run yang diulang tidak menggandakan baris.
     """
     try:
         output_path = os.path.join(os.path.dirname(__file__), "..", output_file)
-        df.to_csv(output_path, index=False)
-        logging.info(f"Data berhasil disimpan ke CSV: {output_path}")
+
+        if partition_by is None:
+            with atomic_csv_writer(output_path, compression) as handle:
+                write_csv_chunks(df, handle, chunksize)
+            logging.info(f"Data berhasil disimpan ke CSV: {output_path}")
+            return True
+
+        if partition_by not in df.columns:
+            raise KeyError(f"Kolom partisi tidak ditemukan: {partition_by}")
+
+        part_name = part_name or f"part-{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        new_partitions = appended = 0
+        for value, part in df.groupby(partition_by, sort=False, dropna=False):
+            partition_dir = os.path.join(output_path, f"{partition_by}={_partition_label(value)}")
+            if os.path.isdir(partition_dir):
+                appended += 1
+            else:
+                new_partitions += 1
+            part_path = os.path.join(partition_dir, f"{part_name}{CSV_EXTENSIONS[compression]}")
+            with atomic_csv_writer(part_path, compression) as handle:
+                write_csv_chunks(part, handle, chunksize)
+        logging.info(
+            f"Data berhasil disimpan ke CSV: {output_path} "
+            f"({len(df)} baris, {new_partitions} partisi baru, {appended} partisi ditambah)"
+        )
         return True
     except Exception as e:
         logging.error(f"Gagal menyimpan ke CSV: {e}")
         return False
 
 
-def upload_to_google_sheets(df: pd.DataFrame):
+def _build_sheets_service():
+    """
+    Membuat client Google Sheets API dari file kredensial service account.
+
+    Client (beserta kredensial dan dokumen discovery) disimpan dan dipakai
+    ulang selama proses berjalan.
+    """
+    global _sheets_service
+    if _sheets_service is None:
+        credential = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+        _sheets_service = build("sheets", "v4", credentials=credential)
+    return _sheets_service
+
+
+def get_engine(db_url: str):
+    """Mengambil engine SQLAlchemy (connection pool) yang dipakai ulang per URL database"""
+    if db_url not in _engine_cache:
+        _engine_cache[db_url] = create_engine(db_url, pool_pre_ping=True)
+    return _engine_cache[db_url]
+
+
+def _column_letter(index: int) -> str:
+    """Mengubah indeks kolom (0 = A) menjadi huruf kolom A1"""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _row_ranges(rows):
+    """Mengelompokkan nomor baris berurutan menjadi rentang (awal, akhir)"""
+    ranges = []
+    for row in sorted(rows):
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return [tuple(r) for r in ranges]
+
+
+def diff_sheet_rows(current, new, key_columns=SHEETS_KEY_COLUMNS, ignore_columns=SHEETS_IGNORE_COLUMNS):
+    """
+    Membandingkan isi sheet saat ini dengan data baru per baris berdasarkan kunci produk.
+
+    Args:
+        current: Isi sheet (baris pertama header), seperti hasil values().get.
+        new: Data baru (baris pertama header).
+
+    Returns:
+        dict: `deletes` (indeks baris data lama yang dihapus), `updates`
+        (pasangan posisi baris data setelah penghapusan dan nilai baru),
+        dan `appends` (baris baru). None jika header berbeda atau sheet
+        kosong, artinya sheet harus ditulis ulang penuh.
+    """
+    header = new[0]
+    if not current or current[0] != header:
+        return None
+
+    width = len(header)
+    key_idx = [header.index(col) for col in key_columns if col in header]
+    compare_idx = [i for i, col in enumerate(header) if col not in ignore_columns]
+
+    def keyed(rows):
+        seen = {}
+        result = {}
+        for i, row in enumerate(rows):
+            row = (list(row) + [""] * width)[:width]
+            base = tuple(row[j] for j in key_idx)
+            seen[base] = seen.get(base, 0) + 1
+            result[base + (seen[base],)] = (i, row)
+        return result
+
+    old_rows = keyed(current[1:])
+    new_rows = keyed(new[1:])
+
+    deletes = sorted(i for key, (i, _) in old_rows.items() if key not in new_rows)
+    deleted = set(deletes)
+    position = {}
+    for i in range(len(current) - 1):
+        if i not in deleted:
+            position[i] = len(position)
+
+    updates, appends = [], []
+    for key, (_, row) in new_rows.items():
+        if key not in old_rows:
+            appends.append(row)
+            continue
+        old_i, old_row = old_rows[key]
+        if any(old_row[j] != row[j] for j in compare_idx):
+            updates.append((position[old_i], row))
+    return {"deletes": deletes, "updates": sorted(updates), "appends": appends}
+
+
+def sync_google_sheets(df: pd.DataFrame, service=None, spreadsheet_id: str = SPREADSHEET_ID,
+                       sheet_name: str = SHEET_NAME, sheet_id: int = SHEET_ID, use_cache: bool = False) -> dict:
+    """
+    Sinkronisasi diff ke Google Sheets: hanya baris yang berubah, baru, atau
+    hilang yang dikirim.
+
+    Baris yang hilang dihapus dalam satu `spreadsheets.batchUpdate`, baris
+    yang berubah dan baris baru ditulis dalam satu `values.batchUpdate`.
+    Jika header berubah, sheet ditulis ulang penuh.
+
+    Args:
+        use_cache: Pakai isi sheet dari sinkronisasi sebelumnya di proses ini
+            alih-alih membaca ulang sheet.
+
+    Returns:
+        dict: Jumlah sel ditulis, baris diperbarui/ditambah/dihapus, dan request API.
+    """
+    service = service or _build_sheets_service()
+    sheet = service.spreadsheets()
+    new = [df.columns.tolist()] + df.astype(str).values.tolist()
+    width = len(new[0])
+    last_col = _column_letter(width - 1)
+    stats = {"cells": 0, "updated": 0, "appended": 0, "deleted": 0, "requests": 0}
+
+    current = _sheet_cache.get(spreadsheet_id) if use_cache else None
+    if current is None:
+        current = sheet.values().get(spreadsheetId=spreadsheet_id, range=sheet_name).execute().get("values", [])
+        stats["requests"] += 1
+
+    diff = diff_sheet_rows(current, new)
+    if diff is None:
+        sheet.values().clear(spreadsheetId=spreadsheet_id, range=sheet_name, body={}).execute()
+        sheet.values().update(
+            spreadsheetId=spreadsheet_id, range=f"{sheet_name}!A1",
+            valueInputOption="RAW", body={"values": new}
+        ).execute()
+        stats.update(requests=stats["requests"] + 2, cells=len(new) * width, appended=len(new) - 1)
+        _sheet_cache[spreadsheet_id] = new
+        return stats
+
+    # Hapus baris dari bawah agar indeks baris di atasnya tidak bergeser
+    if diff["deletes"]:
+        requests = [
+            {"deleteDimension": {"range": {
+                "sheetId": sheet_id, "dimension": "ROWS", "startIndex": start + 1, "endIndex": end + 2
+            }}}
+            for start, end in reversed(_row_ranges(diff["deletes"]))
+        ]
+        sheet.batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests}).execute()
+        stats["requests"] += 1
+
+    deleted = set(diff["deletes"])
+    rows = [current[0]] + [row for i, row in enumerate(current[1:]) if i not in deleted]
+    for position, row in diff["updates"]:
+        rows[position + 1] = row
+    rows.extend(diff["appends"])
+
+    # Posisi baris data -> nomor baris sheet (header di baris 1)
+    changed = {position + 2: row for position, row in diff["updates"]}
+    first_append = len(rows) - len(diff["appends"]) + 1
+    changed.update({first_append + i: row for i, row in enumerate(diff["appends"])})
+
+    data = [
+        {
+            "range": f"{sheet_name}!A{start}:{last_col}{end}",
+            "values": [changed[r] for r in range(start, end + 1)],
+        }
+        for start, end in _row_ranges(changed)
+    ]
+    if data:
+        sheet.values().batchUpdate(
+            spreadsheetId=spreadsheet_id, body={"valueInputOption": "RAW", "data": data}
+        ).execute()
+        stats["requests"] += 1
+
+    stats.update(
+        cells=len(changed) * width, updated=len(diff["updates"]),
+        appended=len(diff["appends"]), deleted=len(diff["deletes"])
+    )
+    _sheet_cache[spreadsheet_id] = rows
+    return stats
+
+
+def upload_to_google_sheets(df: pd.DataFrame, mode: str = "overwrite", service=None):
     """
     Mengunggah DataFrame ke Google Sheets.
+
+    Args:
+        mode: "overwrite" menulis ulang seluruh sel, "diff" hanya mengirim
+            baris yang berubah (lihat sync_google_sheets).
     """
     try:
-        credential = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        service = build("sheets", "v4", credentials=credential)
+        if mode == "diff":
+            stats = sync_google_sheets(df, service=service)
+            logging.info(
+                f"Sinkronisasi Google Sheets selesai. {stats['cells']} sel ditulis "
+                f"({stats['updated']} baris diperbarui, {stats['appended']} ditambah, "
+                f"{stats['deleted']} dihapus, {stats['requests']} request API)."
+            )
+            return True
+
+        service = service or _build_sheets_service()
         sheet = service.spreadsheets()
 
         values = [df.columns.tolist()] + df.astype(str).values.tolist()
@@ -81,15 +437,131 @@ def upload_to_google_sheets(df: pd.DataFrame):
         return False
 
 
-def save_to_postgres(df: pd.DataFrame, db_url: str, table_name: str = "fashion_products"):
+def build_postgres_ddl(table_name: str = "fashion_products", partitioned: bool = False) -> str:
+    """
+    Membuat DDL tabel produk dengan tipe kolom eksplisit dan primary key.
+
+    Jika `partitioned`, tabel dipartisi per `load_date` (RANGE) dan primary
+    key menyertakan kolom partisi sesuai aturan PostgreSQL.
+    """
+    columns = ",\n    ".join(f'"{name}" {sql_type}' for name, sql_type in POSTGRES_COLUMNS)
+    primary_key = '"id", "load_date"' if partitioned else '"id"'
+    partition = " PARTITION BY RANGE (\"load_date\")" if partitioned else ""
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{table_name}" (\n'
+        f'    "id" BIGINT GENERATED ALWAYS AS IDENTITY,\n'
+        f'    "load_date" DATE NOT NULL DEFAULT CURRENT_DATE,\n'
+        f'    {columns},\n'
+        f'    PRIMARY KEY ({primary_key})\n'
+        f'){partition}'
+    )
+
+
+def postgres_index_names(table_name: str = "fashion_products") -> dict:
+    """Nama indeks sekunder per kolom"""
+    return {col: f"idx_{table_name}_{col.lower()}" for col in POSTGRES_INDEX_COLUMNS}
+
+
+def postgres_partition_name(table_name: str, load_date: date) -> str:
+    """Nama partisi harian untuk `load_date`"""
+    return f"{table_name}_{load_date:%Y%m%d}"
+
+
+def _prepare_postgres_load(conn, table_name: str, partitioned: bool, load_date: date, bulk_load: bool) -> int:
+    """
+    Menyiapkan tabel untuk load `load_date` dan mengembalikan jumlah baris
+    lama yang diganti (seluruh tabel jika tidak dipartisi, hanya partisi
+    `load_date` jika dipartisi).
+
+    Indeks hanya dilepas untuk load besar ke tabel tanpa partisi. Pada tabel
+    berpartisi, DROP INDEX di tabel induk melepas indeks semua partisi dan
+    membangunnya ulang atas seluruh riwayat; partisi hari ini sudah
+    dikosongkan, sehingga indeksnya cukup diperbarui saat insert.
+    """
+    existing = {row[0]: row[1] for row in conn.execute(
+        text("SELECT column_name, data_type FROM information_schema.columns WHERE table_name = :t"),
+        {"t": table_name}
+    )}
+    if existing and "load_date" not in existing:
+        # Tabel lama hasil to_sql tanpa skema: simpan dengan nama lain
+        logging.warning(f"Tabel lama {table_name} dipindah ke {table_name}_legacy")
+        conn.execute(text(f'ALTER TABLE "{table_name}" RENAME TO "{table_name}_legacy"'))
+        existing = {}
+
+    conn.execute(text(build_postgres_ddl(table_name, partitioned)))
+
+    # Skema versi sebelumnya membatasi panjang kolom teks dengan VARCHAR(n)
+    for name, sql_type in POSTGRES_COLUMNS:
+        if sql_type.startswith("TEXT") and existing.get(name) == "character varying":
+            conn.execute(text(f'ALTER TABLE "{table_name}" ALTER COLUMN "{name}" TYPE TEXT'))
+
+    if partitioned:
+        partition = postgres_partition_name(table_name, load_date)
+        conn.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{partition}" PARTITION OF "{table_name}" '
+            f"FOR VALUES FROM ('{load_date.isoformat()}') TO ('{(load_date + timedelta(days=1)).isoformat()}')"
+        ))
+        conn.execute(text(f'TRUNCATE "{partition}"'))
+        replaced = 0
+    else:
+        # Tabel tanpa partisi selalu berisi katalog terbaru saja, seperti to_sql(if_exists="replace")
+        replaced = conn.execute(text(f'DELETE FROM "{table_name}"')).rowcount or 0
+
+    if bulk_load and not partitioned:
+        for name in postgres_index_names(table_name).values():
+            conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+    return replaced
+
+
+def _insert_postgres_rows(conn, table_name: str, df: pd.DataFrame, load_date: date):
+    """Memasukkan baris per potongan POSTGRES_INSERT_CHUNK dengan multi-row INSERT"""
+    columns = [name for name, _ in POSTGRES_COLUMNS if name in df.columns]
+    target = table(table_name, column("load_date"), *[column(name) for name in columns])
+    for start in range(0, len(df), POSTGRES_INSERT_CHUNK):
+        chunk = df.iloc[start:start + POSTGRES_INSERT_CHUNK][columns].astype(object)
+        records = chunk.where(chunk.notna(), None).to_dict("records")
+        for record in records:
+            record["load_date"] = load_date
+        conn.execute(insert(target), records)
+
+
+def _finish_postgres_load(conn, table_name: str, changed_rows: int, partition: str = None):
+    """
+    Membuat indeks sekunder yang belum ada dan menjalankan ANALYZE setelah
+    perubahan besar (hanya pada `partition` jika diisi).
+    """
+    for col, name in postgres_index_names(table_name).items():
+        conn.execute(text(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table_name}" ("{col}")'))
+
+    if changed_rows >= POSTGRES_ANALYZE_THRESHOLD:
+        conn.execute(text(f'ANALYZE "{partition or table_name}"'))
+
+
+def save_to_postgres(df: pd.DataFrame, db_url: str, table_name: str = "fashion_products",
+                     partitioned: bool = False, load_date: date = None):
     """
     Menyimpan DataFrame ke database PostgreSQL.
+
+    Tabel dibuat sekali dengan DDL dari build_postgres_ddl (tidak dibangun
+    ulang setiap load). Tanpa `partitioned`, seluruh isi tabel diganti
+    sehingga tabel selalu berisi katalog terbaru. Dengan `partitioned`,
+    riwayat disimpan per hari: hanya partisi `load_date` (default hari ini)
+    yang di-TRUNCATE. Untuk load besar ke tabel tanpa partisi indeks
+    sekunder dilepas lalu dibangun ulang setelah insert. ANALYZE dijalankan
+    setelah perubahan besar, pada partisi hari itu saja jika `partitioned`.
     """
     try:
-        engine = create_engine(db_url)
-        with engine.connect() as conn:
-            df.to_sql(table_name, con=conn, if_exists="replace", index=False)
-        logging.info(f"Data berhasil disimpan ke PostgreSQL ({table_name})")
+        load_date = load_date or date.today()
+        bulk_load = len(df) >= POSTGRES_BULK_THRESHOLD
+
+        engine = get_engine(db_url)
+        with engine.begin() as conn:
+            replaced = _prepare_postgres_load(conn, table_name, partitioned, load_date, bulk_load)
+            _insert_postgres_rows(conn, table_name, df, load_date)
+            partition = postgres_partition_name(table_name, load_date) if partitioned else None
+            _finish_postgres_load(conn, table_name, len(df) + replaced, partition)
+
+        logging.info(f"Data berhasil disimpan ke PostgreSQL ({table_name}, {len(df)} baris)")
         return True
     except SQLAlchemyError as e:
         logging.error(f"Database error: {e}")
@@ -99,12 +571,279 @@ def save_to_postgres(df: pd.DataFrame, db_url: str, table_name: str = "fashion_p
         return False
 
 
-def load_data(df: pd.DataFrame, db_url: str, csv_output: str = "products.csv"):  # Diubah ke products.csv
+def save_to_sqlite(df: pd.DataFrame, db_file: str = LOCAL_DB_FILE,
+                   table_name: str = "fashion_products", if_exists: str = "append"):
+    """
+    Menyimpan DataFrame ke database SQLite lokal untuk analisis tanpa server.
+
+    Seluruh baris dimasukkan dalam satu transaksi (executemany per potongan),
+    lalu indeks pada kolom Title/Gender/Size dibuat jika belum ada. Dengan
+    `if_exists="append"` (default) data baru ditambahkan ke tabel yang ada.
+    """
+    try:
+        db_path = os.path.join(os.path.dirname(__file__), "..", db_file)
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                df.to_sql(
+                    table_name, con=conn, if_exists=if_exists,
+                    index=False, chunksize=LOCAL_DB_CHUNK_ROWS
+                )
+                for col in LOCAL_DB_INDEX_COLUMNS:
+                    if col in df.columns:
+                        conn.execute(
+                            f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{col.lower()}" '
+                            f'ON "{table_name}" ("{col}")'
+                        )
+        finally:
+            conn.close()
+        logging.info(f"Data berhasil disimpan ke SQLite ({db_path}:{table_name})")
+        return True
+    except sqlite3.Error as e:
+        logging.error(f"SQLite error: {e}")
+        return False
+    except Exception as e:
+        logging.error(f"Gagal menyimpan ke SQLite: {e}")
+        return False
+
+
+def query_sqlite(sql: str, db_file: str = LOCAL_DB_FILE, params=None) -> pd.DataFrame:
+    """Menjalankan query baca ke database SQLite lokal dan mengembalikan DataFrame."""
+    db_path = os.path.join(os.path.dirname(__file__), "..", db_file)
+    with closing(sqlite3.connect(db_path)) as conn:
+        return pd.read_sql_query(sql, conn, params=params)
+
+
+class CsvSink:
+    """Sink batch untuk file CSV, ditulis atomik melalui atomic_csv_writer"""
+
+    def __init__(self, output_file: str, columns=None, compression: str = None):
+        self.output_path = os.path.join(os.path.dirname(__file__), "..", output_file)
+        self.columns = list(columns) if columns is not None else None
+        self.compression = compression
+
+    def open(self):
+        self._writer = atomic_csv_writer(self.output_path, self.compression)
+        self._handle = self._writer.__enter__()
+        self._header = True
+
+    def write(self, batch: pd.DataFrame):
+        # Render dulu ke string agar batch yang gagal tidak tertulis sebagian
+        self._handle.write(batch.to_csv(index=False, header=self._header))
+        self._header = False
+
+    def close(self, success: bool):
+        if not success:
+            self._writer.__exit__(RuntimeError, RuntimeError("load CSV dibatalkan"), None)
+            return
+        if self._header and self.columns is not None:
+            self._handle.write(pd.DataFrame(columns=self.columns).to_csv(index=False))
+        self._writer.__exit__(None, None, None)
+
+
+class SheetsSink:
+    """
+    Sink batch untuk Google Sheets (mode overwrite): header ditulis di A1,
+    lalu tiap batch ditulis ke baris berikutnya dengan satu request.
+    """
+
+    def __init__(self, columns, service=None, spreadsheet_id: str = SPREADSHEET_ID,
+                 sheet_name: str = SHEET_NAME):
+        self.columns = list(columns)
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_name = sheet_name
+
+    def _update(self, row: int, values):
+        self._sheet.values().update(
+            spreadsheetId=self.spreadsheet_id,
+            range=f"{self.sheet_name}!A{row}",
+            valueInputOption="RAW",
+            body={"values": values},
+        ).execute()
+
+    def open(self):
+        self._sheet = (self.service or _build_sheets_service()).spreadsheets()
+        self._update(1, [self.columns])
+        self._next_row = 2
+
+    def write(self, batch: pd.DataFrame):
+        self._update(self._next_row, batch.astype(str).values.tolist())
+        self._next_row += len(batch)
+
+    def close(self, success: bool):
+        pass
+
+
+class PostgresSink:
+    """
+    Sink batch untuk PostgreSQL. Seluruh load berjalan dalam satu transaksi;
+    tiap batch dibungkus SAVEPOINT sehingga batch yang gagal dapat dicoba
+    ulang tanpa membatalkan batch sebelumnya.
+    """
+
+    def __init__(self, db_url: str, table_name: str = "fashion_products", partitioned: bool = False,
+                 load_date: date = None, expected_rows: int = 0):
+        self.db_url = db_url
+        self.table_name = table_name
+        self.partitioned = partitioned
+        self.load_date = load_date or date.today()
+        self.expected_rows = expected_rows
+
+    def open(self):
+        self._conn = get_engine(self.db_url).connect()
+        try:
+            self._transaction = self._conn.begin()
+            bulk_load = self.expected_rows >= POSTGRES_BULK_THRESHOLD
+            self._changed = _prepare_postgres_load(
+                self._conn, self.table_name, self.partitioned, self.load_date, bulk_load
+            )
+        except Exception:
+            # run_batched hanya memanggil close() setelah open() berhasil; kembalikan
+            # koneksi ke pool (menutupnya juga me-rollback transaksi yang terbuka)
+            self._conn.close()
+            raise
+
+    def write(self, batch: pd.DataFrame):
+        savepoint = self._conn.begin_nested()
+        try:
+            _insert_postgres_rows(self._conn, self.table_name, batch, self.load_date)
+        except Exception:
+            savepoint.rollback()
+            raise
+        savepoint.commit()
+        self._changed += len(batch)
+
+    def close(self, success: bool):
+        try:
+            if success:
+                partition = postgres_partition_name(self.table_name, self.load_date) if self.partitioned else None
+                _finish_postgres_load(self._conn, self.table_name, self._changed, partition)
+                self._transaction.commit()
+            else:
+                self._transaction.rollback()
+        finally:
+            self._conn.close()
+
+
+class SqliteSink:
+    """
+    Sink batch untuk SQLite lokal. Seluruh load berjalan dalam satu transaksi
+    dengan SAVEPOINT per batch; tabel dibuat dari skema batch pertama.
+    """
+
+    def __init__(self, db_file: str = LOCAL_DB_FILE, table_name: str = "fashion_products",
+                 if_exists: str = "append"):
+        self.db_path = os.path.join(os.path.dirname(__file__), "..", db_file)
+        self.table_name = table_name
+        self.if_exists = if_exists
+
+    def open(self):
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("BEGIN")
+        except Exception:
+            self._conn.close()
+            raise
+        self._columns = None
+
+    def _create_table(self, batch: pd.DataFrame):
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.table_name,)
+        ).fetchone()
+        if exists and self.if_exists == "fail":
+            raise ValueError(f"Tabel {self.table_name} sudah ada.")
+        if exists and self.if_exists == "replace":
+            self._conn.execute(f'DROP TABLE "{self.table_name}"')
+            exists = None
+        if not exists:
+            self._conn.execute(pd.io.sql.get_schema(batch, self.table_name))
+
+    def write(self, batch: pd.DataFrame):
+        self._conn.execute("SAVEPOINT batch")
+        try:
+            if self._columns is None:
+                self._create_table(batch)
+            columns = ", ".join(f'"{col}"' for col in batch.columns)
+            placeholders = ", ".join("?" for _ in batch.columns)
+            rows = batch.astype(object)
+            self._conn.executemany(
+                f'INSERT INTO "{self.table_name}" ({columns}) VALUES ({placeholders})',
+                rows.where(rows.notna(), None).values.tolist(),
+            )
+        except Exception:
+            self._conn.execute("ROLLBACK TO batch")
+            self._conn.execute("RELEASE batch")
+            raise
+        self._conn.execute("RELEASE batch")
+        self._columns = list(batch.columns)
+
+    def close(self, success: bool):
+        try:
+            if success:
+                for col in LOCAL_DB_INDEX_COLUMNS:
+                    if self._columns and col in self._columns:
+                        self._conn.execute(
+                            f'CREATE INDEX IF NOT EXISTS "idx_{self.table_name}_{col.lower()}" '
+                            f'ON "{self.table_name}" ("{col}")'
+                        )
+                self._conn.execute("COMMIT")
+            else:
+                self._conn.execute("ROLLBACK")
+        finally:
+            self._conn.close()
+
+
+def load_batched(df: pd.DataFrame, sinks: dict, batch_sizes: dict = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, max_retries: int = DEFAULT_MAX_RETRIES) -> dict:
+    """
+    Memuat DataFrame ke beberapa destinasi secara paralel, masing-masing
+    dengan batch berukuran tetap melalui antrian terbatas (lihat run_batched).
+
+    Args:
+        sinks (dict): Nama destinasi -> sink (CsvSink, SheetsSink, ...).
+        batch_sizes (dict): Ukuran batch per destinasi; melengkapi LOAD_BATCH_SIZES.
+
+    Returns:
+        dict: Nama destinasi -> statistik load dari run_batched.
+    """
+    sizes = {**LOAD_BATCH_SIZES, **(batch_sizes or {})}
+    if not sinks:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(sinks)) as pool:
+        futures = {
+            name: pool.submit(
+                run_batched, name, iter_batches(df, sizes.get(name, LOAD_DEFAULT_BATCH_SIZE)),
+                sink, queue_size, max_retries
+            )
+            for name, sink in sinks.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def load_data(df: pd.DataFrame, db_url: str, csv_output: str = "products.csv",  # Diubah ke products.csv
+              local_db: str = None, sheets_mode: str = "overwrite", batched: bool = False,
+              batch_sizes: dict = None, destinations=None):
     """
     Memuat data ke semua destinasi yang tersedia.
 
+    Args:
+        local_db: Path file SQLite lokal. Jika diisi, data juga disimpan ke sana.
+        sheets_mode: "overwrite" atau "diff" untuk Google Sheets.
+        batched: Jika True, tiap destinasi dimuat paralel dalam batch
+            berukuran tetap melalui antrian terbatas (lihat load_batched).
+            Google Sheets mode "diff" tetap dikirim sekaligus.
+        batch_sizes: Ukuran batch per destinasi, melengkapi LOAD_BATCH_SIZES.
+        destinations: Nama destinasi yang dimuat (mis. hanya yang gagal pada
+            run sebelumnya); default semua.
+
     Returns:
-        dict: Status tiap operasi (csv, google_sheets, postgresql)
+        dict: Status tiap operasi yang dijalankan (csv, google_sheets,
+        postgresql, dan sqlite jika `local_db` diisi)
     """
     logging.info("Mulai proses pemuatan data...")
 
@@ -118,38 +857,71 @@ def load_data(df: pd.DataFrame, db_url: str, csv_output: str = "products.csv"):
         raise KeyError(f"Kolom hilang: {missing_cols}")
 
     results = {}
+    wanted = set(destinations or ["csv", "google_sheets", "postgresql", "sqlite"])
+
+    if batched:
+        sinks = {}
+        if "csv" in wanted:
+            sinks["csv"] = CsvSink(csv_output, df.columns)
+        if "postgresql" in wanted:
+            sinks["postgresql"] = PostgresSink(db_url, expected_rows=len(df))
+        if "google_sheets" in wanted and sheets_mode == "overwrite":
+            sinks["google_sheets"] = SheetsSink(df.columns)
+        elif "google_sheets" in wanted:
+            results["google_sheets"] = upload_to_google_sheets(df, mode=sheets_mode)
+        if local_db and "sqlite" in wanted:
+            sinks["sqlite"] = SqliteSink(local_db)
+
+        stats = load_batched(df, sinks, batch_sizes)
+        results.update({name: stat["success"] for name, stat in stats.items()})
+        logging.info("Proses pemuatan data selesai.")
+        return {name: results[name] for name in ["csv", "google_sheets", "postgresql", "sqlite"] if name in results}
 
     # Simpan ke CSV
-    try:
-        results["csv"] = save_to_csv(df, csv_output)
-    except Exception as e:
-        logging.error(f"CSV Error: {e}")
-        results["csv"] = False
+    if "csv" in wanted:
+        try:
+            results["csv"] = save_to_csv(df, csv_output)
+        except Exception as e:
+            logging.error(f"CSV Error: {e}")
+            results["csv"] = False
 
     # Upload ke Google Sheets
-    try:
-        results["google_sheets"] = upload_to_google_sheets(df)
-    except Exception as e:
-        logging.error(f"Google Sheets Error: {e}")
-        results["google_sheets"] = False
+    if "google_sheets" in wanted:
+        try:
+            results["google_sheets"] = upload_to_google_sheets(df, mode=sheets_mode)
+        except Exception as e:
+            logging.error(f"Google Sheets Error: {e}")
+            results["google_sheets"] = False
 
     # Simpan ke PostgreSQL
-    try:
-        results["postgresql"] = save_to_postgres(df, db_url)
-    except Exception as e:
-        logging.error(f"PostgreSQL Error: {e}")
-        results["postgresql"] = False
+    if "postgresql" in wanted:
+        try:
+            results["postgresql"] = save_to_postgres(df, db_url)
+        except Exception as e:
+            logging.error(f"PostgreSQL Error: {e}")
+            results["postgresql"] = False
+
+    # Simpan ke SQLite lokal (opsional)
+    if local_db and "sqlite" in wanted:
+        try:
+            results["sqlite"] = save_to_sqlite(df, local_db)
+        except Exception as e:
+            logging.error(f"SQLite Error: {e}")
+            results["sqlite"] = False
 
     logging.info("Proses pemuatan data selesai.")
     return results
 
 
 if __name__ == "__main__":
-    INPUT_CSV = "clean_data.csv"  # ← Masih menggunakan clean_data.csv karena ini file input
+    from utils.mmap_io import CLEAN_DATA_ARROW, CLEAN_DATA_CSV, read_dataframe
+
+    INPUT_CSV = CLEAN_DATA_CSV  # ← Masih menggunakan clean_data.csv karena ini file input
     input_path = os.path.join(os.path.dirname(__file__), "..", INPUT_CSV)
+    arrow_path = os.path.join(os.path.dirname(__file__), "..", CLEAN_DATA_ARROW)
 
     try:
-        df_test = pd.read_csv(input_path)
+        df_test = read_dataframe(arrow_path, input_path)
     except FileNotFoundError:
         logging.error(f"File {input_path} tidak ditemukan.")
         exit(1)
@@ -0,0 +1,87 @@
+"""
+Modul Pembacaan Data Memory-Mapped
+
+Menyimpan data dalam format Arrow IPC (Feather v2) tanpa kompresi agar dapat
+dibaca dengan memory-map:
+- Kolom hasil baca merujuk langsung ke buffer file di disk (zero-copy)
+- Transformasi, profiling, dan loader dapat berbagi buffer yang sama
+- File CSV hasil scraping dikonversi sekali; dibaca ulang hanya jika CSV lebih baru
+"""
+
+import os
+import logging
+import tempfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+
+# Konfigurasi logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+RAW_DATA_CSV = "data_scrapping.csv"
+RAW_DATA_ARROW = "data_scrapping.arrow"
+CLEAN_DATA_CSV = "clean_data.csv"
+CLEAN_DATA_ARROW = "clean_data.arrow"
+
+
+def write_ipc(data, path: str) -> str:
+    """
+    Menyimpan DataFrame atau pa.Table ke file Arrow IPC tanpa kompresi.
+
+    File ditulis ke file sementara lalu di-rename, sehingga pembaca yang
+    sedang memetakan file lama tidak terganggu.
+    """
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return path
+
+
+def csv_to_ipc(csv_path: str, ipc_path: str) -> str:
+    """Mengonversi CSV ke Arrow IPC (string kosong dan 'NaN' dibaca sebagai null seperti pd.read_csv)"""
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+    table = pa_csv.read_csv(csv_path, convert_options=convert_options)
+    logging.info(f"Mengonversi {csv_path} ke {ipc_path} ({table.num_rows} baris)")
+    return write_ipc(table, ipc_path)
+
+
+def read_table(ipc_path: str, csv_path: str = None) -> pa.Table:
+    """
+    Membaca file Arrow IPC dengan memory-map.
+
+    Args:
+        ipc_path (str): Lokasi file Arrow IPC.
+        csv_path (str): CSV sumber; dikonversi jika file IPC belum ada atau
+            lebih lama dari CSV.
+
+    Returns:
+        pa.Table: Tabel yang buffer kolomnya dipetakan dari file (zero-copy).
+    """
+    if csv_path and os.path.exists(csv_path):
+        if not os.path.exists(ipc_path) or os.path.getmtime(ipc_path) < os.path.getmtime(csv_path):
+            csv_to_ipc(csv_path, ipc_path)
+    if not os.path.exists(ipc_path):
+        raise FileNotFoundError(f"File {ipc_path} tidak ditemukan.")
+
+    source = pa.memory_map(ipc_path, "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def read_dataframe(ipc_path: str, csv_path: str = None) -> pd.DataFrame:
+    """
+    Membaca file Arrow IPC sebagai DataFrame yang kolomnya didukung Arrow
+    (pd.ArrowDtype), sehingga tidak ada salinan ke array objek Python.
+    """
+    return read_table(ipc_path, csv_path).to_pandas(types_mapper=pd.ArrowDtype)
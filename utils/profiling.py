@@ -0,0 +1,389 @@
+"""
+Modul Profiling Kualitas Data
+
+Membangun profil data yang dapat digabung (mergeable) selama transformasi,
+potongan demi potongan, tanpa membaca ulang seluruh DataFrame:
+- Jumlah baris, null rate tiap kolom mentah, dan baris yang dibuang
+- Min/max dan sketsa kuantil (DDSketch) untuk kolom numerik hasil bersih
+- Jumlah nilai unik (HyperLogLog) dan rasio duplikat
+- Histogram rating dan jumlah per kategori Size/Gender
+
+Profil disimpan sebagai JSON ringkas per run dan dapat dibandingkan antar run.
+"""
+
+import os
+import json
+import math
+import zlib
+import base64
+import logging
+import numpy as np
+import pandas as pd
+
+
+# Konfigurasi logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+PROFILE_VERSION = 1
+HLL_PRECISION = 10            # 1024 register, galat standar ~3%
+QUANTILE_ACCURACY = 0.01      # Galat relatif kuantil 1%
+RATING_BINS = np.linspace(0.0, 5.0, 11)
+MAX_CATEGORIES = 100
+NUMERIC_COLUMNS = ["Price", "Rating", "Colour"]
+CATEGORY_COLUMNS = ["Size", "Gender"]
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Panjang bit tiap uint64 (0 untuk nilai 0), dihitung per 32 bit agar presisi"""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    """Sketsa HyperLogLog untuk estimasi jumlah nilai unik"""
+
+    def __init__(self, precision: int = HLL_PRECISION, registers: np.ndarray = None):
+        self.precision = precision
+        self.registers = registers if registers is not None else np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray):
+        """Menambahkan hash uint64 (mis. dari pd.util.hash_array)"""
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        remainder = hashes << np.uint64(self.precision)
+        rank = np.minimum(65 - _bit_length(remainder), 64 - self.precision + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def add(self, values):
+        self.add_hashes(pd.util.hash_array(np.asarray(values, dtype=object)))
+
+    def merge(self, other: "HyperLogLog"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        estimate = (0.7213 / (1 + 1.079 / m)) * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self) -> dict:
+        packed = base64.b64encode(zlib.compress(self.registers.tobytes())).decode("ascii")
+        return {"precision": self.precision, "registers": packed}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HyperLogLog":
+        raw = zlib.decompress(base64.b64decode(data["registers"]))
+        return cls(data["precision"], np.frombuffer(raw, dtype=np.uint8).copy())
+
+
+class QuantileSketch:
+    """
+    Sketsa kuantil DDSketch: nilai dikelompokkan ke bucket logaritmik
+    sehingga kuantil memiliki galat relatif maksimal `accuracy`.
+    """
+
+    def __init__(self, accuracy: float = QUANTILE_ACCURACY):
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zeros = 0
+        self.count = 0
+
+    def _add_bins(self, bins: dict, values: np.ndarray):
+        keys, counts = np.unique(np.ceil(np.log(values) / self.log_gamma).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            bins[key] = bins.get(key, 0) + count
+
+    def add(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        self._add_bins(self.positive, values[values > 0])
+        self._add_bins(self.negative, -values[values < 0])
+        self.zeros += int(np.count_nonzero(values == 0))
+        self.count += len(values)
+
+    def merge(self, other: "QuantileSketch"):
+        for mine, theirs in [(self.positive, other.positive), (self.negative, other.negative)]:
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q: float):
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+    def to_dict(self) -> dict:
+        return {
+            "accuracy": self.accuracy,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+            "zeros": self.zeros,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(data["accuracy"])
+        sketch.positive = {int(k): v for k, v in data["positive"].items()}
+        sketch.negative = {int(k): v for k, v in data["negative"].items()}
+        sketch.zeros = data["zeros"]
+        sketch.count = data["count"]
+        return sketch
+
+
+class NumericSummary:
+    """Ringkasan kolom numerik: jumlah, null, min, max, total, dan kuantil"""
+
+    def __init__(self):
+        self.count = 0
+        self.nulls = 0
+        self.min = None
+        self.max = None
+        self.sum = 0.0
+        self.sketch = QuantileSketch()
+
+    def add(self, values: pd.Series):
+        values = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
+        valid = values[~np.isnan(values)]
+        self.count += len(values)
+        self.nulls += len(values) - len(valid)
+        if len(valid):
+            self.min = float(valid.min()) if self.min is None else min(self.min, float(valid.min()))
+            self.max = float(valid.max()) if self.max is None else max(self.max, float(valid.max()))
+            self.sum += float(valid.sum())
+        self.sketch.add(valid)
+
+    def merge(self, other: "NumericSummary"):
+        self.count += other.count
+        self.nulls += other.nulls
+        self.sum += other.sum
+        self.min = other.min if self.min is None else (self.min if other.min is None else min(self.min, other.min))
+        self.max = other.max if self.max is None else (self.max if other.max is None else max(self.max, other.max))
+        self.sketch.merge(other.sketch)
+
+    def to_dict(self) -> dict:
+        valid = self.count - self.nulls
+        return {
+            "count": self.count,
+            "nulls": self.nulls,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / valid if valid else None,
+            "p50": self.sketch.quantile(0.5),
+            "p90": self.sketch.quantile(0.9),
+            "p99": self.sketch.quantile(0.99),
+            "sum": self.sum,
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NumericSummary":
+        summary = cls()
+        summary.count, summary.nulls = data["count"], data["nulls"]
+        summary.min, summary.max, summary.sum = data["min"], data["max"], data["sum"]
+        summary.sketch = QuantileSketch.from_dict(data["sketch"])
+        return summary
+
+
+class DataProfile:
+    """
+    Profil kualitas data satu run, diisi oleh transform_data(profile=...)
+    untuk tiap potongan data dan dapat digabung dengan profil lain.
+    """
+
+    def __init__(self):
+        self.rows = {"raw": 0, "valid": 0, "output": 0}
+        self.raw_nulls = {}
+        self.raw_distinct = {}
+        self.invalid = {}
+        self.numeric = {col: NumericSummary() for col in NUMERIC_COLUMNS}
+        self.rating_histogram = np.zeros(len(RATING_BINS) - 1, dtype=np.int64)
+        self.categories = {col: {} for col in CATEGORY_COLUMNS}
+        self.truncated = set()
+        self.distinct_rows = HyperLogLog()
+
+    def observe(self, raw: pd.DataFrame, cleaned: pd.DataFrame, valid: pd.Series, output_rows: int):
+        """
+        Memperbarui profil dari satu potongan data.
+
+        Args:
+            raw: Data mentah potongan ini.
+            cleaned: Kolom hasil pembersihan sebelum filter baris.
+            valid: Mask baris yang lolos filter (Price, Rating, Colour valid).
+            output_rows: Jumlah baris potongan ini setelah hapus duplikat.
+        """
+        self.rows["raw"] += len(raw)
+        self.rows["valid"] += int(valid.sum())
+        self.rows["output"] += output_rows
+
+        for col in raw.columns:
+            self.raw_nulls[col] = self.raw_nulls.get(col, 0) + int(raw[col].isna().sum())
+            self.raw_distinct.setdefault(col, HyperLogLog()).add(raw[col].to_numpy())
+
+        for col in NUMERIC_COLUMNS:
+            if col in cleaned.columns:
+                self.invalid[col] = self.invalid.get(col, 0) + int(cleaned[col].isna().sum())
+
+        kept = cleaned[valid]
+        for col, summary in self.numeric.items():
+            if col in kept.columns:
+                summary.add(kept[col])
+        if "Rating" in kept.columns:
+            self.rating_histogram += np.histogram(kept["Rating"].to_numpy(dtype=np.float64), bins=RATING_BINS)[0]
+        for col, counts in self.categories.items():
+            if col not in kept.columns or col in self.truncated:
+                continue
+            for value, count in kept[col].value_counts(dropna=False).items():
+                counts[str(value)] = counts.get(str(value), 0) + int(count)
+            if len(counts) > MAX_CATEGORIES:
+                self.truncated.add(col)
+                counts.clear()
+
+        if len(kept):
+            self.distinct_rows.add_hashes(pd.util.hash_pandas_object(kept, index=False).to_numpy())
+
+    def merge(self, other: "DataProfile"):
+        """Menggabungkan profil lain (mis. dari potongan atau proses lain) ke profil ini"""
+        for key in self.rows:
+            self.rows[key] += other.rows[key]
+        for col, nulls in other.raw_nulls.items():
+            self.raw_nulls[col] = self.raw_nulls.get(col, 0) + nulls
+        for col, hll in other.raw_distinct.items():
+            self.raw_distinct.setdefault(col, HyperLogLog()).merge(hll)
+        for col, count in other.invalid.items():
+            self.invalid[col] = self.invalid.get(col, 0) + count
+        for col, summary in other.numeric.items():
+            self.numeric[col].merge(summary)
+        self.rating_histogram += other.rating_histogram
+        self.truncated |= other.truncated
+        for col, counts in other.categories.items():
+            mine = self.categories[col]
+            for value, count in counts.items():
+                mine[value] = mine.get(value, 0) + count
+            if col in self.truncated or len(mine) > MAX_CATEGORIES:
+                self.truncated.add(col)
+                mine.clear()
+        self.distinct_rows.merge(other.distinct_rows)
+
+    def to_dict(self) -> dict:
+        raw_rows = self.rows["raw"]
+        distinct_rows = min(self.distinct_rows.count(), self.rows["valid"])
+        return {
+            "version": PROFILE_VERSION,
+            "rows": dict(self.rows, dropped_invalid=raw_rows - self.rows["valid"]),
+            "raw_columns": {
+                col: {
+                    "nulls": nulls,
+                    "null_rate": nulls / raw_rows if raw_rows else 0.0,
+                    "distinct_estimate": self.raw_distinct[col].count(),
+                    "hll": self.raw_distinct[col].to_dict(),
+                }
+                for col, nulls in self.raw_nulls.items()
+            },
+            "invalid_after_cleaning": self.invalid,
+            "numeric": {col: summary.to_dict() for col, summary in self.numeric.items()},
+            "rating_histogram": {
+                "edges": RATING_BINS.tolist(),
+                "counts": self.rating_histogram.tolist(),
+            },
+            "categories": {col: counts for col, counts in self.categories.items() if col not in self.truncated},
+            "categories_truncated": sorted(self.truncated),
+            "duplicates": {
+                "distinct_rows_estimate": distinct_rows,
+                "duplicate_ratio": 1 - distinct_rows / self.rows["valid"] if self.rows["valid"] else 0.0,
+                "hll": self.distinct_rows.to_dict(),
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DataProfile":
+        profile = cls()
+        profile.rows = {key: data["rows"][key] for key in profile.rows}
+        for col, info in data["raw_columns"].items():
+            profile.raw_nulls[col] = info["nulls"]
+            profile.raw_distinct[col] = HyperLogLog.from_dict(info["hll"])
+        profile.invalid = dict(data["invalid_after_cleaning"])
+        profile.numeric = {col: NumericSummary.from_dict(info) for col, info in data["numeric"].items()}
+        profile.rating_histogram = np.array(data["rating_histogram"]["counts"], dtype=np.int64)
+        profile.truncated = set(data["categories_truncated"])
+        profile.categories = {col: dict(data["categories"].get(col, {})) for col in CATEGORY_COLUMNS}
+        profile.distinct_rows = HyperLogLog.from_dict(data["duplicates"]["hll"])
+        return profile
+
+    def write(self, path: str):
+        """Menyimpan profil sebagai JSON"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, separators=(",", ":"))
+        logging.info(f"Profil data disimpan ke {path}")
+
+
+def read_profile(path: str) -> dict:
+    """Membaca profil JSON yang disimpan DataProfile.write"""
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def latest_profile(directory: str):
+    """Membaca profil terbaru di direktori (nama file diawali run ID terurut waktu)"""
+    if not os.path.isdir(directory):
+        return None
+    names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    return read_profile(os.path.join(directory, names[-1])) if names else None
+
+
+def compare_profiles(previous: dict, current: dict) -> dict:
+    """
+    Membandingkan dua profil (hasil to_dict/read_profile).
+
+    Returns:
+        dict: Nama metrik -> {"previous", "current", "change"} untuk metrik
+        utama: jumlah baris, null rate kolom mentah, statistik numerik, dan
+        rasio duplikat.
+    """
+    def metrics(profile):
+        values = {f"rows.{key}": value for key, value in profile["rows"].items()}
+        for col, info in profile["raw_columns"].items():
+            values[f"raw.{col}.null_rate"] = info["null_rate"]
+            values[f"raw.{col}.distinct_estimate"] = info["distinct_estimate"]
+        for col, info in profile["numeric"].items():
+            for stat in ["min", "max", "mean", "p50", "p90"]:
+                values[f"numeric.{col}.{stat}"] = info[stat]
+        values["duplicates.duplicate_ratio"] = profile["duplicates"]["duplicate_ratio"]
+        return values
+
+    before, after = metrics(previous), metrics(current)
+    result = {}
+    for name in sorted(set(before) | set(after)):
+        old, new = before.get(name), after.get(name)
+        change = new - old if isinstance(old, (int, float)) and isinstance(new, (int, float)) else None
+        result[name] = {"previous": old, "current": new, "change": change}
+    return result
@@ -0,0 +1,205 @@
+"""
+Modul Penjadwal ETL
+
+Komponen untuk menjalankan pipeline sebagai daemon:
+- Jadwal interval (tiap N detik) atau ekspresi cron 5 kolom
+- Metrik run pipeline dalam memori
+- Endpoint HTTP lokal /health (JSON) dan /metrics (format teks Prometheus)
+"""
+
+import json
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Konfigurasi logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+class IntervalSchedule:
+    """Jadwal berulang setiap `seconds` detik"""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("Interval harus lebih dari 0 detik.")
+        self.seconds = seconds
+
+    def next_after(self, moment: datetime) -> datetime:
+        return moment + timedelta(seconds=self.seconds)
+
+
+class CronSchedule:
+    """
+    Jadwal dari ekspresi cron 5 kolom: menit jam tanggal bulan hari.
+
+    Mendukung `*`, daftar (`1,15`), rentang (`1-5`) dan langkah (`*/10`,
+    `8-18/2`). Hari 0 atau 7 = Minggu. Jika kolom tanggal dan hari sama-sama
+    dibatasi, jadwal cocok jika salah satunya cocok (seperti cron).
+    """
+
+    FIELDS = [("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7)]
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Ekspresi cron harus 5 kolom: {expression!r}")
+        self.expression = expression
+        for (name, low, high), part in zip(self.FIELDS, parts):
+            setattr(self, name, self._parse_field(part, low, high))
+        if 7 in self.weekday:
+            self.weekday = (self.weekday - {7}) | {0}
+        self.day_restricted = parts[2] != "*"
+        self.weekday_restricted = parts[4] != "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set:
+        values = set()
+        for item in field.split(","):
+            base, _, step = item.partition("/")
+            step = int(step) if step else 1
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(v) for v in base.split("-", 1))
+            else:
+                start = int(base)
+                end = high if step > 1 else start
+            if not low <= start <= end <= high or step < 1:
+                raise ValueError(f"Nilai cron di luar rentang {low}-{high}: {item!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.day
+        weekday_ok = (moment.isoweekday() % 7) in self.weekday
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Waktu jadwal berikutnya setelah `moment` (resolusi menit)"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.month:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hour:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minute:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Ekspresi cron tidak pernah cocok: {self.expression!r}")
+
+
+class PipelineMetrics:
+    """Metrik run pipeline yang aman diakses dari thread HTTP"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.runs = {"success": 0, "failed": 0}
+        self.running = False
+        self.last_status = None
+        self.last_run_at = None
+        self.last_success_at = None
+        self.last_duration = None
+        self.last_items = None
+        self.next_run_at = None
+
+    def run_started(self):
+        with self._lock:
+            self.running = True
+
+    def run_finished(self, success: bool, duration: float, items: int = None):
+        with self._lock:
+            status = "success" if success else "failed"
+            self.runs[status] += 1
+            self.running = False
+            self.last_status = status
+            self.last_run_at = time.time()
+            self.last_duration = duration
+            self.last_items = items
+            if success:
+                self.last_success_at = self.last_run_at
+
+    def set_next_run(self, moment: datetime):
+        with self._lock:
+            self.next_run_at = moment.timestamp()
+
+    def health(self) -> dict:
+        """Status kesehatan: `failing` jika run terakhir gagal"""
+        with self._lock:
+            return {
+                "status": "failing" if self.last_status == "failed" else "ok",
+                "running": self.running,
+                "last_status": self.last_status,
+                "last_run_at": self.last_run_at,
+                "last_success_at": self.last_success_at,
+                "next_run_at": self.next_run_at,
+                "uptime_seconds": round(time.time() - self.started, 1),
+            }
+
+    def prometheus(self) -> str:
+        """Metrik dalam format teks Prometheus"""
+        with self._lock:
+            lines = [
+                "# TYPE etl_runs_total counter",
+                *[f'etl_runs_total{{status="{status}"}} {count}' for status, count in self.runs.items()],
+                "# TYPE etl_running gauge",
+                f"etl_running {int(self.running)}",
+            ]
+            gauges = {
+                "etl_last_run_duration_seconds": self.last_duration,
+                "etl_last_run_items": self.last_items,
+                "etl_last_success_timestamp_seconds": self.last_success_at,
+                "etl_next_run_timestamp_seconds": self.next_run_at,
+            }
+            for name, value in gauges.items():
+                if value is not None:
+                    lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+            return "\n".join(lines) + "\n"
+
+
+def start_health_server(metrics: PipelineMetrics, host: str = "127.0.0.1", port: int = 8000):
+    """
+    Menjalankan server HTTP /health dan /metrics di thread latar.
+
+    Returns:
+        ThreadingHTTPServer: Server yang berjalan (panggil shutdown() untuk berhenti).
+    """
+
+    class HealthHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/health":
+                payload = metrics.health()
+                body = json.dumps(payload).encode("utf-8")
+                self._reply(200 if payload["status"] == "ok" else 503, "application/json", body)
+            elif self.path == "/metrics":
+                self._reply(200, "text/plain; version=0.0.4", metrics.prometheus().encode("utf-8"))
+            else:
+                self._reply(404, "text/plain", b"Not Found")
+
+        def _reply(self, status, content_type, body):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), HealthHandler)
+    threading.Thread(target=server.serve_forever, name="etl-health", daemon=True).start()
+    logging.info(f"Endpoint health/metrics aktif di http://{host}:{server.server_address[1]}")
+    return server
@@ -2,12 +2,18 @@
 Modul Transformasi Data Fashion
 
 Membersihkan data hasil ekstraksi dengan aturan spesifik:
-- Price: konversi ke rupiah
+- Price: konversi ke rupiah berdasarkan tabel kurs (Amount & Currency asli disimpan)
 - Rating: float saja
 - Colors: hanya angka
 - Size & Gender: dibersihkan dari teks tambahan
 """
 
+import os
+import json
+import time
+import hashlib
+import inspect
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import logging
@@ -20,14 +26,81 @@ logging.basicConfig(
 )
 
 
-def convert_price(price_str):
-    """Konversi harga dari $ ke IDR (x16000)"""
-    if isinstance(price_str, str) and price_str.startswith("$"):
-        try:
-            return float(price_str.replace("$", "")) * 16000
-        except ValueError:
-            return float('nan')
-    return float('nan')
+# Konfigurasi kurs mata uang
+EXCHANGE_RATE_FILE = os.path.join(os.path.dirname(__file__), "..", "exchange_rates.csv")
+EXCHANGE_RATE_TTL = 3600  # detik
+DEFAULT_EXCHANGE_RATES = pd.DataFrame({
+    "Currency": ["IDR", "USD"],
+    "Rate": [1.0, 16000.0],
+    "Date": pd.to_datetime(["1970-01-01", "1970-01-01"]),
+})
+CURRENCY_SYMBOLS = {"US$": "USD", "$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "Rp": "IDR"}
+PRICE_PATTERN = r"^\s*(?P<Currency>US\$|\$|€|£|¥|Rp|[A-Z]{3})\s*(?P<Amount>\d[\d,]*(?:\.\d+)?)\s*$"
+
+# Cache tabel kurs di memori: path -> (waktu dimuat, DataFrame)
+_exchange_rate_cache = {}
+
+
+def load_exchange_rates(path: str = EXCHANGE_RATE_FILE, ttl: float = EXCHANGE_RATE_TTL) -> pd.DataFrame:
+    """
+    Membaca tabel kurs (kolom Currency, Rate, Date) dari file CSV lokal.
+
+    Hasil disimpan di cache memori selama `ttl` detik. Jika file tidak ada,
+    dipakai kurs bawaan (USD x16000).
+    """
+    cached = _exchange_rate_cache.get(path)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    try:
+        rates = pd.read_csv(path, parse_dates=["Date"])
+        missing_cols = [col for col in ["Currency", "Rate", "Date"] if col not in rates.columns]
+        if missing_cols:
+            raise KeyError(f"Kolom kurs hilang: {missing_cols}")
+    except FileNotFoundError:
+        logging.warning(f"File kurs {path} tidak ditemukan, memakai kurs bawaan.")
+        rates = DEFAULT_EXCHANGE_RATES
+
+    rates = rates.sort_values("Date", kind="stable").reset_index(drop=True)
+    _exchange_rate_cache[path] = (time.monotonic(), rates)
+    return rates
+
+
+def rates_as_of(rates: pd.DataFrame, as_of=None) -> pd.Series:
+    """Mengambil kurs terbaru tiap mata uang yang berlaku pada tanggal `as_of`"""
+    as_of = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp(datetime.now())
+    valid = rates[rates["Date"] <= as_of]
+    return valid.groupby("Currency")["Rate"].last().astype(float)
+
+
+def normalize_prices(prices: pd.Series, rates: pd.DataFrame = None, as_of=None) -> pd.DataFrame:
+    """
+    Konversi harga ke IDR secara vektor untuk seluruh kolom sekaligus.
+
+    str.extract menjalankan regex per elemen, sehingga hanya string harga
+    unik yang di-parse lalu hasilnya dipetakan kembali ke tiap baris.
+
+    Returns:
+        pd.DataFrame: Kolom Price (IDR), Amount (nilai asli), dan Currency (kode ISO).
+        Harga yang tidak valid atau mata uang tanpa kurs menghasilkan NaN.
+    """
+    if rates is None:
+        rates = load_exchange_rates()
+
+    codes, uniques = pd.factorize(prices)
+    parts = pd.Series(uniques, dtype=object).astype("string").str.extract(PRICE_PATTERN)
+    currency = parts["Currency"].replace(CURRENCY_SYMBOLS).astype(object)
+    currency = currency.where(currency.notna(), float("nan"))
+    amount = pd.to_numeric(parts["Amount"].str.replace(",", "", regex=False), errors="coerce").astype(float)
+    rate = currency.map(rates_as_of(rates, as_of)).astype(float)
+
+    # Kode -1 (harga kosong) menunjuk ke baris NaN tambahan di akhir
+    codes = np.where(codes < 0, len(uniques), codes)
+    return pd.DataFrame({
+        "Price": np.append((amount * rate).to_numpy(), np.nan)[codes],
+        "Amount": np.append(amount.to_numpy(), np.nan)[codes],
+        "Currency": np.append(currency.to_numpy(dtype=object), np.nan)[codes],
+    }, index=prices.index)
 
 
 def clean_rating(rating_str):
@@ -64,12 +137,185 @@ def clean_gender(gender_str):
     return gender_str.replace("Gender: ", "").strip() if isinstance(gender_str, str) else ""
 
 
-def transform_data(df: pd.DataFrame) -> pd.DataFrame:
+class ColumnRule:
+    """
+    Aturan pembersihan yang menghasilkan satu atau beberapa kolom output.
+
+    Args:
+        outputs: Kolom yang dihasilkan aturan ini.
+        inputs: Kolom mentah yang dibaca dari data hasil extract.
+        func: Fungsi pembersih. Aturan elementwise dipanggil per nilai,
+            aturan vektor dipanggil sekali dengan Series utuh dan konteks
+            (rates, as_of) lalu mengembalikan DataFrame berisi `outputs`.
+        elementwise: True jika `func` bekerja per nilai. Aturan elementwise
+            dengan satu kolom input dipanggil sekali per nilai unik, sehingga
+            `func` harus deterministik.
+        requires: Kolom turunan (output aturan lain) yang dibutuhkan.
+        dtype: Tipe data hasil aturan elementwise, jika perlu dipaksakan.
+    """
+
+    def __init__(self, outputs, inputs, func, elementwise=False, requires=(), dtype=None):
+        self.outputs = tuple(outputs)
+        self.inputs = tuple(inputs)
+        self.func = func
+        self.elementwise = elementwise
+        self.requires = tuple(requires)
+        self.dtype = dtype
+
+    @property
+    def name(self):
+        return self.func.__name__
+
+
+# Registry aturan: kolom output -> ColumnRule
+TRANSFORM_RULES = {}
+
+# Baris dengan nilai kosong pada kolom ini dibuang dari hasil transformasi
+ROW_FILTER_COLUMNS = ["Price", "Rating", "Colour"]
+
+
+def register_rule(outputs, inputs, func, elementwise=False, requires=(), dtype=None):
+    """Mendaftarkan aturan pembersihan kolom ke registry transformasi"""
+    rule = ColumnRule(outputs, inputs, func, elementwise, requires, dtype)
+    for col in rule.outputs:
+        TRANSFORM_RULES[col] = rule
+    return rule
+
+
+# 1. Kolom Harga → konversi ke IDR, simpan nilai & mata uang asli
+register_rule(["Price", "Amount", "Currency"], ["Price"], normalize_prices)
+# 2. Kolom Rating → float valid
+register_rule(["Rating"], ["Rating"], clean_rating, elementwise=True)
+# 3. Kolom Warna → hanya angka
+register_rule(["Colour"], ["Colour"], extract_color_count, elementwise=True)
+# 4. Ukuran → bersihkan teks "Size: "
+register_rule(["Size"], ["Size"], clean_size, elementwise=True, dtype=str)
+# 5. Gender → bersihkan teks "Gender: "
+register_rule(["Gender"], ["Gender"], clean_gender, elementwise=True, dtype=str)
+
+
+# Naikkan jika logika transformasi berubah di luar kode yang di-hash transform_fingerprint()
+TRANSFORM_VERSION = 1
+
+
+def transform_fingerprint() -> str:
+    """
+    Fingerprint logika transformasi: TRANSFORM_VERSION, pola harga, filter
+    baris, kode transform_data, dan registry aturan beserta kode fungsinya.
+    Berubah setiap kali aturan ditambah atau diubah, sehingga checkpoint
+    transform lama tidak dipakai ulang.
+    """
+    def source(func):
+        try:
+            return inspect.getsource(func)
+        except (OSError, TypeError):
+            return f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', type(func).__name__)}"
+
+    rules = {id(rule): rule for rule in TRANSFORM_RULES.values()}.values()
+    parts = [
+        TRANSFORM_VERSION, PRICE_PATTERN, CURRENCY_SYMBOLS, ROW_FILTER_COLUMNS,
+        source(transform_data), source(evaluate_columns),
+        sorted(
+            [list(rule.outputs), list(rule.inputs), rule.elementwise, list(rule.requires),
+             str(rule.dtype), source(rule.func)]
+            for rule in rules
+        ),
+    ]
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def plan_transform(columns) -> list:
+    """
+    Menyusun urutan eksekusi aturan untuk menghasilkan `columns`.
+
+    Hanya aturan yang dibutuhkan kolom tersebut (beserta dependensinya)
+    yang dimasukkan, diurutkan per level dependensi.
+
+    Returns:
+        list: Daftar ColumnRule; dependensi tiap aturan berada sebelumnya.
+    """
+    levels = {}
+
+    def visit(col, path=()):
+        rule = TRANSFORM_RULES.get(col)
+        if rule is None:
+            return -1
+        if col in path:
+            raise ValueError(f"Dependensi melingkar pada kolom: {col}")
+        if rule not in levels:
+            levels[rule] = 1 + max([visit(dep, path + (col,)) for dep in rule.requires], default=-1)
+        return levels[rule]
+
+    for col in columns:
+        visit(col)
+
+    return sorted(levels, key=levels.get)
+
+
+def _run_elementwise_rule(rule, raw: pd.DataFrame, computed: dict) -> pd.Series:
+    """
+    Menjalankan aturan elementwise. Kolom hasil scraping banyak berulang
+    (Size, Gender, Rating, Colour), sehingga untuk satu kolom input fungsi
+    hanya dipanggil sekali per nilai unik lalu hasilnya dipetakan ke tiap baris.
+    """
+    args = [raw[c] for c in rule.inputs] + [computed[c] for c in rule.requires]
+    if len(args) == 1:
+        codes, uniques = pd.factorize(args[0], use_na_sentinel=False)
+        values = [rule.func(value) for value in uniques.tolist()]
+        out = pd.Series(values, dtype=None if values else object).to_numpy()[codes]
+    else:
+        out = [rule.func(*row) for row in zip(*(arg.tolist() for arg in args))]
+
+    series = pd.Series(out, index=raw.index, dtype=None if len(out) else object)
+    return series.astype(rule.dtype) if rule.dtype else series
+
+
+def evaluate_columns(df: pd.DataFrame, columns, rates: pd.DataFrame = None, as_of=None) -> dict:
+    """
+    Menghitung kolom turunan yang dibutuhkan `columns` secara lazy.
+
+    Returns:
+        dict: Nama kolom -> Series hasil aturan yang dijalankan.
+    """
+    computed = {}
+    for rule in plan_transform(columns):
+        if rule.elementwise:
+            computed[rule.outputs[0]] = _run_elementwise_rule(rule, df, computed)
+            continue
+        args = [df[c] for c in rule.inputs] + [computed[c] for c in rule.requires]
+        result = rule.func(*args, rates=rates, as_of=as_of)
+        for col in rule.outputs:
+            computed[col] = result[col]
+    return computed
+
+
+def default_output_columns(df: pd.DataFrame) -> list:
+    """Kolom output bawaan: kolom input, kolom turunan tambahan, lalu Timestamp"""
+    extra = [col for col in TRANSFORM_RULES if col not in df.columns]
+    return list(df.columns) + extra + ["Timestamp"]
+
+
+TRANSFORM_BACKENDS = ["pandas", "arrow"]
+
+
+def transform_data(df: pd.DataFrame, rates: pd.DataFrame = None, as_of=None, columns=None,
+                   backend: str = "pandas", profile=None) -> pd.DataFrame:
     """
     Melakukan transformasi data tanpa menyimpan ke file.
 
     Args:
         df (pd.DataFrame): Data mentah dari extract.
+        rates (pd.DataFrame): Tabel kurs; default dibaca dari EXCHANGE_RATE_FILE.
+        as_of: Tanggal acuan kurs; default saat ini.
+        columns (list): Kolom output yang diminta; default semua kolom.
+            Hanya aturan yang dibutuhkan kolom ini dan filter baris
+            (Price, Rating, Colour) yang dijalankan. Duplikat dihapus
+            berdasarkan kolom yang diminta.
+        backend (str): "pandas" (acuan) atau "arrow" (kernel vektor
+            pyarrow.compute; hanya untuk kolom bawaan).
+        profile (DataProfile): Jika diberikan, diperbarui dengan statistik
+            data mentah dan hasil pembersihan dalam pass yang sama
+            (hanya backend pandas).
 
     Returns:
         pd.DataFrame: Data hasil transformasi.
@@ -85,45 +331,96 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     if missing_cols:
         raise KeyError(f"Kolom hilang: {missing_cols}")
 
-    df = df.copy()
-
-    # 1. Kolom Harga → konversi ke IDR
-    df["Price"] = df["Price"].apply(convert_price)
-
-    # 2. Kolom Rating → float valid
-    df["Rating"] = df["Rating"].apply(clean_rating)
-
-    # 3. Kolom Warna → hanya angka
-    df["Colour"] = df["Colour"].apply(extract_color_count)
-
-    # 4. Ukuran → bersihkan teks "Size: "
-    df["Size"] = df["Size"].apply(clean_size).astype(str)
-
-    # 5. Gender → bersihkan teks "Gender: "
-    df["Gender"] = df["Gender"].apply(clean_gender).astype(str)
+    if backend not in TRANSFORM_BACKENDS:
+        raise ValueError(f"Backend tidak dikenal: {backend}")
+    if backend == "arrow":
+        if columns is not None:
+            raise ValueError("Backend arrow hanya mendukung kolom bawaan.")
+        if profile is not None:
+            raise ValueError("Profil data hanya didukung backend pandas.")
+        from utils.transform_arrow import transform_dataframe
+        return transform_dataframe(df, rates, as_of)
+
+    output_columns = default_output_columns(df) if columns is None else list(columns)
+    unknown_cols = [
+        col for col in output_columns
+        if col not in TRANSFORM_RULES and col not in df.columns and col != "Timestamp"
+    ]
+    if unknown_cols:
+        raise KeyError(f"Kolom tidak dikenal: {unknown_cols}")
+    data_columns = [col for col in output_columns if col != "Timestamp"]
+
+    # Hitung hanya kolom yang diminta dan kolom filter
+    raw = df
+    computed = evaluate_columns(df, data_columns + ROW_FILTER_COLUMNS, rates, as_of)
+    df = pd.DataFrame(
+        {col: computed[col] if col in computed else df[col] for col in data_columns + ROW_FILTER_COLUMNS},
+        index=df.index,
+    )
 
     # Filter baris yang memiliki nilai invalid pada kolom penting
-    df = df.dropna(subset=["Price", "Rating", "Colour"]).copy()
+    valid = df[ROW_FILTER_COLUMNS].notna().all(axis=1)
+    cleaned = df
+    df = df[valid][data_columns].copy()
 
     # Hapus duplikat dan reset index
     df = df.drop_duplicates().reset_index(drop=True)
 
+    if profile is not None:
+        profile.observe(raw, cleaned[data_columns], valid, len(df))
+
     # Bersihkan nama kolom dari spasi berlebih
     df.columns = df.columns.str.strip()
 
     # Tambahkan timestamp
-    df["Timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if "Timestamp" in output_columns:
+        df["Timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     logging.info("Transformasi berhasil.")
     return df
 
 
+def transform_chunks(chunks, rates: pd.DataFrame = None, as_of=None, profile=None) -> pd.DataFrame:
+    """
+    Mentransformasi data mentah potongan demi potongan (mis. dari
+    pd.read_csv(..., chunksize=N)) dan menggabungkan hasilnya.
+
+    Args:
+        chunks: Iterable DataFrame mentah.
+        rates (pd.DataFrame): Tabel kurs; default dibaca dari EXCHANGE_RATE_FILE.
+        as_of: Tanggal acuan kurs; default saat ini.
+        profile (DataProfile): Profil yang diperbarui tiap potongan.
+
+    Returns:
+        pd.DataFrame: Data hasil transformasi tanpa duplikat antar potongan.
+    """
+    if rates is None:
+        rates = load_exchange_rates()
+    output_before = profile.rows["output"] if profile is not None else 0
+    parts = [transform_data(chunk, rates, as_of, profile=profile) for chunk in chunks]
+    if not parts:
+        return pd.DataFrame()
+
+    result = pd.concat(parts, ignore_index=True)
+    key_columns = [col for col in result.columns if col != "Timestamp"]
+    result = result.drop_duplicates(subset=key_columns).reset_index(drop=True)
+    if profile is not None:
+        profile.rows["output"] = output_before + len(result)
+    return result
+
+
 if __name__ == "__main__":
-    INPUT_CSV = "data_scrapping.csv"
+    import sys
+
+    # Tambahkan path root proyek agar bisa import dari utils saat dijalankan langsung
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils.mmap_io import RAW_DATA_ARROW, RAW_DATA_CSV, CLEAN_DATA_ARROW, read_dataframe, write_ipc
+
+    INPUT_CSV = RAW_DATA_CSV
 
     print("Mulai proses transformasi data fashion...\n")
     try:
-        df_raw = pd.read_csv(INPUT_CSV)
+        df_raw = read_dataframe(RAW_DATA_ARROW, INPUT_CSV)
         print(f"Berhasil membaca {len(df_raw)} baris dari {INPUT_CSV}")
 
         df_clean = transform_data(df_raw)
@@ -131,6 +428,7 @@ if __name__ == "__main__":
         if not df_clean.empty:
             OUTPUT_CSV = "clean_data.csv"
             df_clean.to_csv(OUTPUT_CSV, index=False)
+            write_ipc(df_clean, CLEAN_DATA_ARROW)
             print(f"Data berhasil dibersihkan dan disimpan ke {OUTPUT_CSV}")
             print("\nContoh data hasil:")
             print(df_clean.head())
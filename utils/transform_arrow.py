@@ -0,0 +1,169 @@
+"""
+Backend Arrow untuk Transformasi Data Fashion
+
+Implementasi aturan pembersihan yang sama dengan utils/transform.py
+menggunakan pyarrow.compute. Kernel Arrow bekerja per kolom tanpa loop
+Python, serta menerima dan mengembalikan pyarrow.Table sehingga kolom
+yang tidak diubah tidak disalin. Kernel elementwise berjalan di satu
+thread; hanya pencarian duplikat (group_by) yang memakai banyak thread.
+
+Backend pandas di utils/transform.py tetap menjadi acuan hasil.
+"""
+
+import logging
+from functools import reduce
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.transform import (
+    CURRENCY_SYMBOLS, PRICE_PATTERN, ROW_FILTER_COLUMNS, TRANSFORM_RULES,
+    load_exchange_rates, rates_as_of,
+)
+
+
+# Token angka yang diterima float() (tanpa nan/inf)
+FLOAT_TOKEN_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+DIGIT_TOKEN_PATTERN = r"^\d+$"
+
+
+def _as_string(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Nilai non-string diperlakukan sebagai null, sama seperti cek isinstance(str)"""
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        return column
+    return pa.nulls(len(column), pa.string())
+
+
+def _first_valid_token(text, pattern: str, low=None, high=None) -> pa.Array:
+    """
+    Mengambil token (dipisah whitespace) pertama yang cocok dengan `pattern`
+    dan berada dalam rentang [low, high], sebagai float64. Null jika tidak ada.
+    """
+    tokens = pc.utf8_split_whitespace(text)
+    if isinstance(tokens, pa.ChunkedArray):
+        tokens = tokens.combine_chunks()
+    flat = pc.list_flatten(tokens)
+    parents = pc.list_parent_indices(tokens).to_numpy(zero_copy_only=False)
+
+    is_number = pc.match_substring_regex(flat, pattern)
+    values = pc.cast(pc.if_else(is_number, flat, pa.scalar(None, pa.string())), pa.float64())
+    valid = pc.is_valid(values)
+    if low is not None:
+        valid = pc.and_(valid, pc.greater_equal(values, low))
+    if high is not None:
+        valid = pc.and_(valid, pc.less_equal(values, high))
+    valid = pc.fill_null(valid, False).to_numpy(zero_copy_only=False)
+
+    # Token pertama yang valid untuk tiap baris (parents sudah terurut)
+    valid_parents = parents[valid]
+    valid_values = values.to_numpy(zero_copy_only=False)[valid]
+    first = np.ones(len(valid_parents), dtype=bool)
+    first[1:] = valid_parents[1:] != valid_parents[:-1]
+
+    result = np.full(len(tokens), np.nan)
+    result[valid_parents[first]] = valid_values[first]
+    return pa.array(result, from_pandas=True)
+
+
+def normalize_prices_arrow(prices, rates: pd.DataFrame = None, as_of=None) -> dict:
+    """Padanan normalize_prices: mengembalikan kolom Price (IDR), Amount, dan Currency"""
+    if rates is None:
+        rates = load_exchange_rates()
+
+    parts = pc.extract_regex(_as_string(prices), PRICE_PATTERN)
+    matched = pc.is_valid(parts)
+    null_string = pa.scalar(None, pa.string())
+    symbol = pc.if_else(matched, pc.struct_field(parts, "Currency"), null_string)
+    amount_text = pc.if_else(matched, pc.struct_field(parts, "Amount"), null_string)
+
+    symbols = pa.array(list(CURRENCY_SYMBOLS))
+    codes = pa.array(list(CURRENCY_SYMBOLS.values()))
+    currency = pc.coalesce(pc.take(codes, pc.index_in(symbol, value_set=symbols)), symbol)
+
+    amount = pc.cast(pc.replace_substring(amount_text, ",", ""), pa.float64())
+    rate_table = rates_as_of(rates, as_of)
+    rate = pc.take(
+        pa.array(rate_table.values, pa.float64()),
+        pc.index_in(currency, value_set=pa.array(rate_table.index.astype(str), pa.string())),
+    )
+    return {"Price": pc.multiply(amount, rate), "Amount": amount, "Currency": currency}
+
+
+def clean_rating_arrow(ratings) -> pa.Array:
+    """Padanan clean_rating: float pertama antara 0–5, null jika invalid/unknown"""
+    text = _as_string(ratings)
+    lower = pc.utf8_lower(text)
+    rejected = pc.or_(pc.match_substring(lower, "invalid"), pc.match_substring(lower, "unknown"))
+    values = _first_valid_token(text, FLOAT_TOKEN_PATTERN, 0.0, 5.0)
+    return pc.if_else(pc.fill_null(rejected, False), pa.scalar(None, pa.float64()), values)
+
+
+def extract_color_count_arrow(colours) -> pa.Array:
+    """Padanan extract_color_count: token angka pertama sebagai jumlah warna"""
+    return _first_valid_token(_as_string(colours), DIGIT_TOKEN_PATTERN)
+
+
+def clean_label_arrow(values, prefix: str) -> pa.Array:
+    """Padanan clean_size/clean_gender: hapus prefix lalu trim, null menjadi string kosong"""
+    cleaned = pc.utf8_trim_whitespace(pc.replace_substring(_as_string(values), prefix, ""))
+    return pc.fill_null(cleaned, "")
+
+
+def _drop_duplicates(table: pa.Table) -> pa.Table:
+    """Menghapus baris duplikat dan mempertahankan kemunculan pertama"""
+    keys = [name for name in table.column_names if not pa.types.is_null(table.schema.field(name).type)]
+    if not keys or table.num_rows == 0:
+        return table
+    indexed = table.select(keys).append_column("__row", pa.array(np.arange(table.num_rows)))
+    first_rows = indexed.group_by(keys, use_threads=True).aggregate([("__row", "min")])
+    return table.take(np.sort(first_rows["__row_min"].to_numpy()))
+
+
+def transform_table(table: pa.Table, rates: pd.DataFrame = None, as_of=None) -> pa.Table:
+    """
+    Padanan transform_data untuk pyarrow.Table.
+
+    Args:
+        table (pa.Table): Data mentah dari extract.
+        rates (pd.DataFrame): Tabel kurs; default dibaca dari EXCHANGE_RATE_FILE.
+        as_of: Tanggal acuan kurs; default saat ini.
+
+    Returns:
+        pa.Table: Data hasil transformasi dengan kolom yang sama seperti backend pandas.
+    """
+    logging.info("Memulai proses transformasi data (backend arrow)...")
+
+    required_columns = ["Title", "Price", "Rating", "Colour", "Size", "Gender"]
+    missing_cols = [col for col in required_columns if col not in table.column_names]
+    if missing_cols:
+        raise KeyError(f"Kolom hilang: {missing_cols}")
+
+    columns = {name: table[name] for name in table.column_names}
+    columns.update(normalize_prices_arrow(table["Price"], rates, as_of))
+    columns["Rating"] = clean_rating_arrow(table["Rating"])
+    colour = extract_color_count_arrow(table["Colour"])
+    # Backend pandas menghasilkan int64 jika semua baris valid
+    columns["Colour"] = colour if colour.null_count else pc.cast(colour, pa.int64())
+    columns["Size"] = clean_label_arrow(table["Size"], "Size: ")
+    columns["Gender"] = clean_label_arrow(table["Gender"], "Gender: ")
+
+    output_columns = table.column_names + [col for col in TRANSFORM_RULES if col not in table.column_names]
+    result = pa.table({name.strip(): columns[name] for name in output_columns})
+
+    # Filter baris yang memiliki nilai invalid pada kolom penting
+    mask = reduce(pc.and_, [pc.is_valid(result[col]) for col in ROW_FILTER_COLUMNS])
+    result = _drop_duplicates(result.filter(mask))
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    result = result.append_column("Timestamp", pa.array([timestamp] * result.num_rows, pa.string()))
+
+    logging.info("Transformasi berhasil.")
+    return result
+
+
+def transform_dataframe(df: pd.DataFrame, rates: pd.DataFrame = None, as_of=None) -> pd.DataFrame:
+    """Menjalankan transform_table untuk DataFrame pandas"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    return transform_table(table, rates, as_of).to_pandas()